@@ -0,0 +1,75 @@
+"""
+bench_import.py
+
+Measure the import cost of mth308 in fresh interpreter processes.
+
+Each scenario runs in a new `python -c` process, so module caches do not carry
+over between repeats. The time reported is measured inside the child around the
+import statement; the list of heavy modules shows which third-party packages
+each scenario pulls in.
+
+Usage:
+    python benchmarks/bench_import.py [--repeat 20]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCENARIOS = {
+    'import mth308': 'import mth308',
+    'from mth308 import bisection_method': 'from mth308 import bisection_method',
+    'from mth308 import rk4': 'from mth308 import rk4',
+    'from mth308 import euler_method': 'from mth308 import euler_method',
+}
+
+HEAVY = ('numpy', 'matplotlib', 'concurrent.futures', 'multiprocessing')
+
+CHILD = """
+import sys, time, json
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+print(json.dumps({{'time': elapsed, 'heavy': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def run_scenario(statement, repeat):
+    """Return the import times of statement over repeat fresh processes and the heavy modules it loads."""
+    code = CHILD.format(statement=statement, heavy=HEAVY)
+    env = dict(os.environ, PYTHONPATH=ROOT + os.pathsep + os.environ.get('PYTHONPATH', ''))
+    times, heavy = [], []
+    for _ in range(repeat):
+        out = subprocess.run([sys.executable, '-c', code], env=env, check=True,
+                             capture_output=True, text=True).stdout
+        result = json.loads(out)
+        times.append(result['time'])
+        heavy = result['heavy']
+    return times, heavy
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument('--repeat', type=int, default=20, help='processes per scenario (default: 20)')
+    parser.add_argument('--json', help='also write the results to this JSON file')
+    args = parser.parse_args()
+
+    results = {}
+    print(f"{'scenario':40s} {'median':>10s} {'min':>10s}  heavy modules loaded")
+    for name, statement in SCENARIOS.items():
+        times, heavy = run_scenario(statement, args.repeat)
+        results[name] = {'median': statistics.median(times), 'min': min(times), 'heavy': heavy}
+        print(f"{name:40s} {1e3 * statistics.median(times):8.2f}ms {1e3 * min(times):8.2f}ms  "
+              f"{', '.join(heavy) or '-'}")
+
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump(results, fh, indent=2)
+
+
+if __name__ == "__main__":
+    main()
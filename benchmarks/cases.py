@@ -0,0 +1,527 @@
+"""
+cases.py
+
+Benchmark cases for every public function of mth308.
+
+A case is registered with @case(name, kind, cap) on a setup function. The
+setup receives a problem size (taken from the preset's list for the case's
+kind and capped at cap) and returns (run, counter): run() performs the
+measured work once, and counter (or None) counts the evaluations of the
+integrand or right-hand side made by run(). Names of the form
+'function[variant]' cover `function`.
+"""
+import math
+from collections import namedtuple
+
+import numpy as np
+
+import mth308
+
+Case = namedtuple('Case', 'name kind cap setup')
+
+CASES = []
+
+# Problem sizes per kind
+SIZES = {
+    'quick': {
+        'matrix': [10, 100, 400],
+        'grid': [10**3, 10**5],
+        'steps': [10**3, 10**4],
+        'tol': [1e-6, 1e-10],
+        'members': [10**3, 10**4],
+    },
+    'full': {
+        'matrix': [10, 100, 1000, 4000],
+        'grid': [10**3, 10**5, 10**6, 10**8],
+        'steps': [10**3, 10**4, 10**5],
+        'tol': [1e-6, 1e-10, 1e-13],
+        'members': [10**3, 10**4, 10**5],
+    },
+}
+
+
+def case(name, kind, cap=None):
+    """Register a benchmark case; cap bounds the size for pure-Python O(n^2) and O(n^3) routines."""
+    def register(setup):
+        CASES.append(Case(name, kind, cap, setup))
+        return setup
+    return register
+
+
+def sizes(c, preset):
+    """Sizes at which case c runs in the given preset."""
+    return [s for s in SIZES[preset][c.kind] if c.cap is None or s <= c.cap]
+
+
+class Counter:
+    """Wrap f and count its calls and the number of points it was evaluated at."""
+
+    def __init__(self, f):
+        self.f = f
+        self.reset()
+
+    def reset(self):
+        self.calls = 0
+        self.points = 0
+
+    def __call__(self, *args):
+        self.calls += 1
+        # Batched and multi-dimensional integrands evaluate at every broadcast point
+        self.points += np.broadcast(*args).size
+        return self.f(*args)
+
+
+class OdeCounter(Counter):
+    """Counter for right-hand sides f(t, y): one evaluation per call (per member for ensembles)."""
+
+    def __init__(self, f, members=1):
+        super().__init__(f)
+        self.members = members
+
+    def __call__(self, t, y):
+        self.calls += 1
+        self.points += self.members
+        return self.f(t, y)
+
+
+def _rng():
+    return np.random.default_rng(12345)
+
+
+def _dominant(n):
+    """Dense, strictly diagonally dominant test matrix and right-hand side."""
+    rng = _rng()
+    A = rng.random((n, n)) + n * np.eye(n)
+    return A, rng.random(n)
+
+
+def _spd(n):
+    rng = _rng()
+    B = rng.random((n, n))
+    return B @ B.T + n * np.eye(n), rng.random(n)
+
+
+def _banded(n, l=2, u=3):
+    A, b = _dominant(n)
+    return np.triu(np.tril(A, u), -l), b
+
+
+# Linear systems
+
+@case('solve', 'matrix')
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.solve(A, b), None
+
+
+@case('inspect_matrix', 'matrix')
+def _(n):
+    from mth308 import auto_solve
+    A, _ = _dominant(n)
+
+    def run():
+        auto_solve._inspection_cache.clear()
+        mth308.inspect_matrix(A)
+    return run, None
+
+
+@case('gaussian_elimination', 'matrix', cap=1000)
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.gaussian_elimination(A, b.reshape(-1, 1)), None
+
+
+@case('lu_doolittle', 'matrix')
+def _(n):
+    A, _ = _dominant(n)
+    return lambda: mth308.lu_doolittle(A), None
+
+
+@case('lu_crout', 'matrix')
+def _(n):
+    A, _ = _dominant(n)
+    return lambda: mth308.lu_crout(A), None
+
+
+@case('lu_pivot', 'matrix')
+def _(n):
+    A, _ = _dominant(n)
+    return lambda: mth308.lu_pivot(A), None
+
+
+@case('lu_solve', 'matrix')
+def _(n):
+    A, b = _dominant(n)
+    L, U = mth308.lu_doolittle(A)
+    return lambda: mth308.lu_solve(L, U, b), None
+
+
+@case('cholesky', 'matrix')
+def _(n):
+    A, _ = _spd(n)
+    return lambda: mth308.cholesky(A), None
+
+
+@case('CholeskyFactor', 'matrix')
+def _(n):
+    A, b = _spd(n)
+    factor = mth308.cholesky(A)
+    return lambda: factor.solve(b), None
+
+
+@case('ldl', 'matrix')
+def _(n):
+    A, _ = _spd(n)
+    return lambda: mth308.ldl(A), None
+
+
+@case('LDLFactor', 'matrix')
+def _(n):
+    A, b = _spd(n)
+    factor = mth308.ldl(A)
+    return lambda: factor.solve(b), None
+
+
+@case('is_positive_definite', 'matrix')
+def _(n):
+    A, _ = _spd(n)
+    return lambda: mth308.is_positive_definite(A), None
+
+
+@case('bandwidth', 'matrix')
+def _(n):
+    A, _ = _banded(n)
+    return lambda: mth308.bandwidth(A), None
+
+
+@case('to_banded', 'matrix')
+def _(n):
+    A, _ = _banded(n)
+    return lambda: mth308.to_banded(A, 2, 3), None
+
+
+@case('banded_solve', 'matrix')
+def _(n):
+    A, b = _banded(n)
+    ab = mth308.to_banded(A, 2, 3)
+    return lambda: mth308.banded_solve(ab, b, 2, 3), None
+
+
+@case('tridiagonal_solve', 'grid', cap=10**6)
+def _(n):
+    rng = _rng()
+    dl, du, b = rng.random(n - 1), rng.random(n - 1), rng.random(n)
+    d = 4 + rng.random(n)
+    return lambda: mth308.tridiagonal_solve(dl, d, du, b), None
+
+
+@case('gauss_seidel', 'matrix')
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.gauss_seidel(A, b, max_iter=25), None
+
+
+@case('jacobi', 'matrix', cap=400)
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.jacobi(A, b, np.zeros(n), max_iter=25), None
+
+
+@case('block_jacobi', 'matrix')
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.block_jacobi(A, b, max_iter=25), None
+
+
+@case('sor_solver', 'matrix', cap=400)
+def _(n):
+    A, b = _dominant(n)
+    return lambda: mth308.sor_solver(A, b, np.zeros(n), 1.1, 25), None
+
+
+@case('power_method', 'matrix')
+def _(n):
+    A, _ = _spd(n)
+    return lambda: mth308.power_method(A, np.ones(n), tol=1e-8), None
+
+
+# Root finding (size = tolerance)
+
+_ROOT_F = lambda x: x**3 - 2 * x - 5
+_ROOT_DF = lambda x: 3 * x**2 - 2
+
+
+@case('bisection_method', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.bisection_method(f, 2, 3, N=200, eps=tol), f
+
+
+@case('regula_falsi', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.regula_falsi(f, 2, 3, N=200, tol=tol), f
+
+
+@case('modified_regula_falsi', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.modified_regula_falsi(f, 2, 3, tol=tol, max_iter=200), f
+
+
+@case('newton_raphson', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.newton_raphson(f, _ROOT_DF, 2.0, tol=tol), f
+
+
+@case('secant_method', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.secant_method(f, 2.0, 3.0, tol=tol), f
+
+
+@case('SolverResult', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.bisection_method(f, 2, 3, N=200, eps=tol, return_result=True), f
+
+
+@case('IterationProfiler', 'tol')
+def _(tol):
+    f = Counter(_ROOT_F)
+    return lambda: mth308.bisection_method(f, 2, 3, N=200, eps=tol, callback=mth308.IterationProfiler()), f
+
+
+# Interpolation (size = number of nodes)
+
+@case('divided_difference_table', 'matrix')
+def _(n):
+    x = np.linspace(0, 1, n)
+    return lambda: mth308.divided_difference_table(x, np.sin(x)), None
+
+
+@case('newton_divided_diff', 'matrix')
+def _(n):
+    x = np.linspace(0, 1, n)
+    return lambda: mth308.newton_divided_diff(x, np.sin(x)), None
+
+
+@case('newton_coefficients', 'matrix')
+def _(n):
+    x = np.linspace(0, 1, n)
+    return lambda: mth308.newton_coefficients(x, np.sin(x)), None
+
+
+@case('NewtonInterpolant', 'matrix')
+def _(n):
+    x = mth308.chebyshev_nodes(n)
+    t = np.linspace(-1, 1, 10**5)
+    return lambda: mth308.NewtonInterpolant(x, np.sin(x))(t), None
+
+
+@case('chebyshev_nodes', 'grid')
+def _(n):
+    return lambda: mth308.chebyshev_nodes(n), None
+
+
+@case('chebyshev_weights', 'grid')
+def _(n):
+    return lambda: mth308.chebyshev_weights(n), None
+
+
+@case('barycentric_weights', 'matrix')
+def _(n):
+    x = mth308.chebyshev_nodes(n)
+    return lambda: mth308.barycentric_weights(x), None
+
+
+@case('BarycentricInterpolant', 'matrix')
+def _(n):
+    x = mth308.chebyshev_nodes(n)
+    p = mth308.BarycentricInterpolant(x, np.sin(x), weights=mth308.chebyshev_weights(n))
+    t = np.linspace(-1, 1, 10**4)
+    return lambda: p(t), None
+
+
+@case('chebyshev_interpolant', 'matrix')
+def _(n):
+    f = Counter(np.sin)
+    return lambda: mth308.chebyshev_interpolant(f, n), f
+
+
+@case('LinearSpline', 'grid', cap=10**6)
+def _(n):
+    x = np.linspace(0, 10, n)
+    t = _rng().uniform(0, 10, 10**5)
+    return lambda: mth308.LinearSpline(x, np.sin(x))(t), None
+
+
+@case('CubicSpline', 'grid', cap=10**6)
+def _(n):
+    x = np.linspace(0, 10, n)
+    t = _rng().uniform(0, 10, 10**5)
+    return lambda: mth308.CubicSpline(x, np.sin(x))(t), None
+
+
+# Integration (size = number of sub-intervals or points)
+
+@case('trapezoidal_rule', 'grid')
+def _(N):
+    f = Counter(np.exp)
+    return lambda: mth308.trapezoidal_rule(f, 0, 1, N=N, vectorized=True), f
+
+
+@case('trapezoidal_rule[scalar]', 'grid', cap=10**6)
+def _(N):
+    f = Counter(math.exp)
+    return lambda: mth308.trapezoidal_rule(f, 0, 1, N=N), f
+
+
+@case('trapezoidal_rule[params]', 'grid', cap=10**6)
+def _(N):
+    f = Counter(lambda x, k: np.exp(-k * x))
+    k = np.linspace(1, 10, 100)
+    return lambda: mth308.trapezoidal_rule(f, 0, 1, N=N, params=k), f
+
+
+@case('simpsons_one_third', 'grid')
+def _(N):
+    f = Counter(np.exp)
+    return lambda: mth308.simpsons_one_third(f, 0, 1, N=N, vectorized=True), f
+
+
+@case('simpsons_one_third[scalar]', 'grid', cap=10**6)
+def _(N):
+    f = Counter(math.exp)
+    return lambda: mth308.simpsons_one_third(f, 0, 1, N=N), f
+
+
+@case('romberg', 'tol')
+def _(tol):
+    f = Counter(math.exp)
+    return lambda: mth308.romberg(f, 0, 1, tol=tol), f
+
+
+@case('adaptive_simpson', 'tol')
+def _(tol):
+    f = Counter(lambda x: 1 / (1e-4 + x * x))
+    return lambda: mth308.adaptive_simpson(f, -1, 1, tol=tol), f
+
+
+@case('gauss_legendre', 'grid', cap=10**6)
+def _(N):
+    f = Counter(np.exp)
+    return lambda: mth308.gauss_legendre(f, 0, 1, n=10, panels=N // 10), f
+
+
+@case('gauss_legendre_nodes', 'matrix')
+def _(n):
+    def run():
+        mth308.gauss_legendre_nodes.cache_clear()
+        mth308.gauss_legendre_nodes(n)
+    return run, None
+
+
+@case('trapezoid_samples', 'grid')
+def _(N):
+    y = np.sin(np.linspace(0, 10, N + 1))
+    return lambda: mth308.trapezoid_samples(y, dx=10 / N), None
+
+
+@case('trapezoid_samples[cumulative]', 'grid')
+def _(N):
+    y = np.sin(np.linspace(0, 10, N + 1))
+    return lambda: mth308.trapezoid_samples(y, dx=10 / N, cumulative=True), None
+
+
+@case('simpson_samples', 'grid')
+def _(N):
+    y = np.sin(np.linspace(0, 10, N + 1))
+    return lambda: mth308.simpson_samples(y, dx=10 / N), None
+
+
+@case('tensor_cubature', 'grid', cap=10**6)
+def _(N):
+    f = Counter(lambda x, y, z: np.exp(x + y + z))
+    n = max(2, round(N ** (1 / 3)))
+    return lambda: mth308.tensor_cubature(f, [(0, 1)] * 3, n=n), f
+
+
+@case('sobol', 'grid', cap=10**6)
+def _(N):
+    return lambda: mth308.sobol(N, 6), None
+
+
+@case('halton', 'grid', cap=10**6)
+def _(N):
+    return lambda: mth308.halton(N, 6), None
+
+
+@case('qmc_integrate', 'grid', cap=10**6)
+def _(N):
+    f = Counter(lambda *x: np.prod(x, axis=0))
+    return lambda: mth308.qmc_integrate(f, [(0, 1)] * 6, n=max(2, N // 8), seed=0), f
+
+
+# ODEs (size = number of steps)
+
+def _oscillators(t, y):
+    return np.concatenate((y[10:], -y[:10]))
+
+
+@case('euler_method', 'steps')
+def _(n):
+    f = OdeCounter(_oscillators)
+    return lambda: mth308.euler_method(f, 0, 1, np.ones(20), N=n), f
+
+
+@case('rk4', 'steps')
+def _(n):
+    f = OdeCounter(_oscillators)
+    return lambda: mth308.rk4(f, 0, np.ones(20), 1 / n, n), f
+
+
+@case('rk4[every]', 'steps')
+def _(n):
+    f = OdeCounter(_oscillators)
+    return lambda: mth308.rk4(f, 0, np.ones(20), 1 / n, n, every=100), f
+
+
+@case('rk45', 'tol')
+def _(tol):
+    f = OdeCounter(_oscillators)
+    return lambda: mth308.rk45(f, 0, np.ones(20), 10, rtol=tol, atol=tol * 1e-3), f
+
+
+def _stiff(t, y):
+    return np.array([-1000 * (y[0] - np.cos(t)), y[0] - y[1]])
+
+
+@case('backward_euler', 'steps')
+def _(n):
+    f = OdeCounter(_stiff)
+    return lambda: mth308.backward_euler(f, 0, [0.0, 0.0], 1 / n, n), f
+
+
+@case('bdf2', 'steps')
+def _(n):
+    f = OdeCounter(_stiff)
+    return lambda: mth308.bdf2(f, 0, [0.0, 0.0], 1 / n, n), f
+
+
+@case('rosenbrock', 'steps')
+def _(n):
+    f = OdeCounter(_stiff)
+    return lambda: mth308.rosenbrock(f, 0, [0.0, 0.0], 1 / n, n, jac_every=10), f
+
+
+@case('ensemble_solve', 'members')
+def _(m):
+    f = OdeCounter(lambda t, Y: np.stack((Y[:, 1], -Y[:, 0]), axis=1), members=0)
+    Y0 = _rng().normal(size=(m, 2))
+
+    def counted(t, Y):
+        f.members = len(Y)
+        return f(t, Y)
+    return lambda: mth308.ensemble_solve(counted, 0, Y0, 0.01, 100), f
@@ -0,0 +1,193 @@
+"""
+run_benchmarks.py
+
+Benchmark every public function of mth308 at several problem sizes.
+
+For each case in cases.py and each size of the chosen preset, the wall time
+(min and median over repeats), the peak memory allocated during one run
+(tracemalloc, measured in a separate run so it does not slow the timed ones)
+and the number of function evaluations are recorded and written as JSON.
+Every case is timed at least MIN_REPEAT times, and comparisons use the minimum
+over the repeats, which is the estimate least disturbed by other load on the
+machine. Given a baseline file, results that are slower or use more memory
+than the baseline by more than the threshold are reported and the exit status
+is 1, so CI can flag regressions. A case that looks slower is measured again
+(up to --retries times) before it is reported: a real slowdown persists across
+the runs, while one disturbed by the machine does not.
+
+Usage:
+    python benchmarks/run_benchmarks.py [--preset quick|full] [--filter rk4]
+        [--output results.json] [--baseline benchmarks/baseline.json]
+        [--save-baseline] [--threshold 0.5] [--retries 3] [--check-coverage]
+"""
+import argparse
+import datetime
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [ROOT, HERE]
+
+import numpy as np  # noqa: E402
+
+import mth308  # noqa: E402
+from cases import CASES, sizes  # noqa: E402
+
+BASELINE = os.path.join(HERE, 'baseline.json')
+
+# Time every case at least MIN_REPEAT times, and keep repeating fast cases until
+# MIN_TIME seconds were spent or MAX_REPEAT runs were made
+MIN_REPEAT = 5
+MIN_TIME = 0.2
+MAX_REPEAT = 50
+
+# Absolute differences below these are treated as noise when comparing with a baseline
+MIN_TIME_DIFF = 1e-3
+MIN_BYTES_DIFF = 64 * 1024
+
+
+def missing_cases():
+    """Public names of mth308 that no benchmark case covers."""
+    covered = {c.name.split('[')[0] for c in CASES}
+    return sorted(set(mth308.__all__) - covered)
+
+
+def measure(setup, size):
+    """Run one case at one size and return its result entry."""
+    run, counter = setup(size)
+    times = []
+    while len(times) < MIN_REPEAT or (len(times) < MAX_REPEAT and sum(times) < MIN_TIME):
+        if counter is not None:
+            counter.reset()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+    calls = None if counter is None else counter.calls
+    points = None if counter is None else counter.points
+
+    tracemalloc.start()
+    try:
+        run()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {'time_min': min(times), 'time_median': statistics.median(times), 'repeats': len(times),
+            'peak_bytes': peak, 'n_fevals': points, 'n_calls': calls}
+
+
+def select(preset, pattern=None, keys=None):
+    """Yield (key, case, size) for the cases matching the glob pattern, or with the given keys."""
+    for c in CASES:
+        if pattern and not fnmatch.fnmatch(c.name, pattern) and pattern not in c.name:
+            continue
+        for size in sizes(c, preset):
+            key = f"{c.name}[{size:g}]"
+            if keys is None or key in keys:
+                yield key, c, size
+
+
+def run_all(preset, pattern=None, keys=None, verbose=True):
+    """Measure every selected case at every size of preset."""
+    results = {}
+    for key, c, size in select(preset, pattern, keys):
+        results[key] = entry = measure(c.setup, size)
+        if verbose:
+            fevals = '-' if entry['n_fevals'] is None else entry['n_fevals']
+            print(f"{key:48s} {1e3 * entry['time_min']:10.3f}ms {1e3 * entry['time_median']:10.3f}ms "
+                  f"{entry['peak_bytes'] / 2**20:9.2f}MiB {fevals:>10}", flush=True)
+    return results
+
+
+def compare(results, baseline, threshold):
+    """Return the regressions of results with respect to baseline results as (key, kind, message)."""
+    regressions = []
+    for key, entry in results.items():
+        ref = baseline.get(key)
+        if ref is None:
+            continue
+        t, t_ref = entry['time_min'], ref['time_min']
+        if t > t_ref * (1 + threshold) and t - t_ref > MIN_TIME_DIFF:
+            regressions.append((key, 'time', f"{key}: time {1e3 * t_ref:.3f}ms -> {1e3 * t:.3f}ms "
+                                             f"({t / t_ref - 1:+.0%})"))
+        m, m_ref = entry['peak_bytes'], ref['peak_bytes']
+        if m > m_ref * (1 + threshold) and m - m_ref > MIN_BYTES_DIFF:
+            regressions.append((key, 'memory', f"{key}: peak memory {m_ref} -> {m} bytes "
+                                               f"({m / max(m_ref, 1) - 1:+.0%})"))
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[2])
+    parser.add_argument('--preset', choices=['quick', 'full'], default='quick',
+                        help='problem sizes to run (default: quick)')
+    parser.add_argument('--filter', help='only run cases whose name contains or matches this glob')
+    parser.add_argument('--output', help='write the results to this JSON file')
+    parser.add_argument('--baseline', help='compare against this JSON file and exit 1 on regressions')
+    parser.add_argument('--save-baseline', action='store_true', help=f'write the results to {BASELINE}')
+    parser.add_argument('--threshold', type=float, default=0.5,
+                        help='relative slowdown or memory growth reported as a regression (default: 0.5)')
+    parser.add_argument('--retries', type=int, default=3,
+                        help='times a slower case is measured again before it is reported (default: 3)')
+    parser.add_argument('--check-coverage', action='store_true',
+                        help='only check that every public function has a case')
+    args = parser.parse_args()
+
+    missing = missing_cases()
+    if args.check_coverage:
+        if missing:
+            print("No benchmark case for: " + ", ".join(missing))
+            sys.exit(1)
+        print(f"All {len(mth308.__all__)} public names are covered by {len(CASES)} cases.")
+        return
+    if missing:
+        print("Warning: no benchmark case for: " + ", ".join(missing))
+
+    print(f"{'case[size]':48s} {'min':>12s} {'median':>12s} {'peak':>12s} {'fevals':>10s}")
+    report = {
+        'meta': {'python': platform.python_version(), 'numpy': np.__version__,
+                 'platform': platform.platform(), 'machine': platform.machine(),
+                 'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds')},
+        'preset': args.preset,
+        'results': run_all(args.preset, args.filter),
+    }
+
+    if args.baseline:
+        with open(args.baseline) as fh:
+            baseline = json.load(fh)
+        regressions = compare(report['results'], baseline['results'], args.threshold)
+        for _ in range(args.retries):
+            slower = {key for key, kind, _ in regressions if kind == 'time'}
+            if not slower:
+                break
+            # Measure apparent slowdowns again and keep the fastest run
+            print(f"Measuring {len(slower)} slower case(s) again:")
+            for key, entry in run_all(args.preset, keys=slower).items():
+                if entry['time_min'] < report['results'][key]['time_min']:
+                    report['results'][key] = entry
+            regressions = compare(report['results'], baseline['results'], args.threshold)
+
+    # Written after the retries, so the files hold the timings that were compared
+    for path in filter(None, (args.output, BASELINE if args.save_baseline else None)):
+        with open(path, 'w') as fh:
+            json.dump(report, fh, indent=2, sort_keys=True)
+        print(f"Results written to {path}")
+
+    if args.baseline:
+        if regressions:
+            print(f"{len(regressions)} regression(s) against {args.baseline}:")
+            for _, _, line in regressions:
+                print("  " + line)
+            sys.exit(1)
+        print(f"No regressions against {args.baseline} (threshold {args.threshold:.0%}).")
+
+
+if __name__ == "__main__":
+    main()
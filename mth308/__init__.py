@@ -1,16 +1,83 @@
-from .bisection import bisection_method
-from .ctr_num_int import trapezoidal_rule
-from .divided_diff import divided_difference_table, newton_divided_diff
-from .euler import euler_method
-from .gauss_seidel import gauss_seidel
-from .gaussian_elim import gaussian_elimination
-from .jacobi import jacobi
-from .lu import lu_doolittle, lu_crout
-from .mrf import modified_regula_falsi
-from .newton_raphson import newton_raphson
-from .power_method import power_method
-from .regula_falsi import regula_falsi
-from .rk4 import rk4
-from .secant import secant_method
-from .simpsons import simpsons_one_third
-from .sor import sor_solver
\ No newline at end of file
+"""
+mth308: numerical methods for root finding, linear systems, interpolation,
+integration and ODEs.
+
+Submodules and the functions they export are imported on first use (module
+level __getattr__), so `import mth308` stays cheap and only the parts of the
+library that are actually used are loaded.
+"""
+import importlib
+import sys
+import types
+
+# Public name -> submodule defining it
+_EXPORTS = {
+    'solve': 'auto_solve', 'inspect_matrix': 'auto_solve',
+    'bandwidth': 'banded', 'to_banded': 'banded', 'banded_solve': 'banded', 'tridiagonal_solve': 'banded',
+    'barycentric_weights': 'barycentric', 'chebyshev_nodes': 'barycentric', 'chebyshev_weights': 'barycentric',
+    'BarycentricInterpolant': 'barycentric', 'chebyshev_interpolant': 'barycentric',
+    'bisection_method': 'bisection',
+    'cholesky': 'cholesky', 'ldl': 'cholesky', 'is_positive_definite': 'cholesky',
+    'CholeskyFactor': 'cholesky', 'LDLFactor': 'cholesky',
+    'trapezoidal_rule': 'ctr_num_int', 'romberg': 'ctr_num_int',
+    'tensor_cubature': 'cubature', 'sobol': 'cubature', 'halton': 'cubature', 'qmc_integrate': 'cubature',
+    'divided_difference_table': 'divided_diff', 'newton_divided_diff': 'divided_diff',
+    'newton_coefficients': 'divided_diff', 'NewtonInterpolant': 'divided_diff',
+    'ensemble_solve': 'ensemble',
+    'euler_method': 'euler',
+    'gauss_seidel': 'gauss_seidel',
+    'gauss_legendre': 'gauss_legendre', 'gauss_legendre_nodes': 'gauss_legendre',
+    'gaussian_elimination': 'gaussian_elim',
+    'jacobi': 'jacobi', 'block_jacobi': 'jacobi',
+    'lu_doolittle': 'lu', 'lu_crout': 'lu', 'lu_pivot': 'lu', 'lu_solve': 'lu',
+    'modified_regula_falsi': 'mrf',
+    'newton_raphson': 'newton_raphson',
+    'power_method': 'power_method',
+    'regula_falsi': 'regula_falsi',
+    'SolverResult': 'result', 'IterationProfiler': 'result',
+    'rk4': 'rk4',
+    'rk45': 'rk45',
+    'trapezoid_samples': 'sampled', 'simpson_samples': 'sampled',
+    'secant_method': 'secant',
+    'simpsons_one_third': 'simpsons', 'adaptive_simpson': 'simpsons',
+    'sor_solver': 'sor',
+    'LinearSpline': 'spline', 'CubicSpline': 'spline',
+    'backward_euler': 'stiff', 'bdf2': 'stiff', 'rosenbrock': 'stiff',
+}
+
+_SUBMODULES = set(_EXPORTS.values()) | {'_ode_output', '_quadrature'}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        value = getattr(importlib.import_module('.' + _EXPORTS[name], __name__), name)
+    elif name in _SUBMODULES:
+        value = importlib.import_module('.' + name, __name__)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | _SUBMODULES | set(__all__))
+
+
+class _Package(types.ModuleType):
+    """
+    Package module that keeps functions bound over same-named submodules.
+
+    Importing a submodule binds it as an attribute of the package. Where a
+    submodule exports a function of the same name (rk4.rk4, cholesky.cholesky,
+    ...), the function is bound instead, as with the former eager imports.
+    """
+
+    def __setattr__(self, name, value):
+        if isinstance(value, types.ModuleType) and _EXPORTS.get(name) == name:
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
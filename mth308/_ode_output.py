@@ -0,0 +1,117 @@
+"""
+Output sinks for the fixed-step ODE solvers.
+
+A sink receives the state after every step and keeps every k-th one (and the
+last). The kept rows go to in-memory arrays, to a .npy file or array (written
+sequentially in blocks of rows [t, y...]), or to a callback called once per
+block, so the memory used by the solver does not grow with the number of steps.
+"""
+import os
+
+import numpy as np
+
+# Default number of rows buffered before a block is written
+BLOCK_SIZE = 4096
+
+
+class OutputSink:
+    """
+    Collect the states of an n_steps integration and deliver them to out.
+
+    out is None (return arrays), a path (a .npy file created with open_memmap),
+    an array of shape (rows, 1 + state size) such as an np.memmap, or a
+    callable called as out(t_block, y_block).
+    """
+
+    def __init__(self, n_steps, every, out, shape, dtype, block_size=BLOCK_SIZE):
+        every = int(every)
+        if every < 1:
+            raise ValueError("every must be a positive integer.")
+        self.n_steps = n_steps
+        self.every = every
+        self.shape = shape
+        self.rows = n_steps // every + 1 + (n_steps % every != 0)
+        self.size = int(np.prod(shape, dtype=int))
+        self.dtype = np.result_type(dtype, float)
+        self.pos = 0
+        self.callback = None
+
+        if out is None:
+            self.t = np.empty(self.rows)
+            self.w = np.empty((self.rows, self.size), dtype=self.dtype)
+            self.target = None
+            return
+
+        if callable(out):
+            self.callback = out
+            self.target = None
+        elif isinstance(out, (str, os.PathLike)):
+            self.target = np.lib.format.open_memmap(out, mode='w+', dtype=self.dtype,
+                                                    shape=(self.rows, 1 + self.size))
+        elif isinstance(out, np.ndarray):
+            if out.shape != (self.rows, 1 + self.size):
+                raise ValueError(f"out must have shape {(self.rows, 1 + self.size)}.")
+            self.target = out
+        else:
+            raise ValueError("out must be None, a path, an array or a callable.")
+        self.buffer = np.empty((min(max(1, int(block_size)), self.rows), 1 + self.size), dtype=self.dtype)
+        self.filled = 0
+
+    def wants(self, i):
+        """Whether the state after step i is kept."""
+        return i % self.every == 0 or i == self.n_steps
+
+    def write(self, t, y):
+        """Keep the time t and the flat state y."""
+        if self.target is None and self.callback is None:
+            self.t[self.pos] = t
+            self.w[self.pos] = y
+            self.pos += 1
+            return
+        row = self.buffer[self.filled]
+        row[0] = t
+        row[1:] = y
+        self.filled += 1
+        if self.filled == len(self.buffer):
+            self._flush()
+
+    def _flush(self):
+        k = self.filled
+        if k == 0:
+            return
+        block = self.buffer[:k]
+        if self.callback is not None:
+            self.callback(block[:, 0].real.copy(), block[:, 1:].reshape((k,) + self.shape).copy())
+        else:
+            self.target[self.pos:self.pos + k] = block
+        self.pos += k
+        self.filled = 0
+
+    def result(self):
+        """
+        Flush the last block and return (t, w).
+
+        For arrays and files, w is a view of the state columns with shape
+        (rows,) + state shape; for a callback, (t, w) is the final time and state.
+        In memory, only the rows written so far are returned, so a solver that
+        stops early does not return uninitialized rows.
+        """
+        if self.target is None and self.callback is None:
+            return self.t[:self.pos], self.w[:self.pos].reshape((self.pos,) + self.shape)
+        # With an empty buffer, the last row of the block just written is the final state
+        last_t, last_y = self.buffer[self.filled - 1, 0].real, self.buffer[self.filled - 1, 1:].copy()
+        self._flush()
+        if self.callback is not None:
+            return last_t, last_y.reshape(self.shape)
+        if isinstance(self.target, np.memmap):
+            self.target.flush()
+        if len(self.shape) == 0:
+            w = self.target[:, 1]
+        elif len(self.shape) == 1:
+            w = self.target[:, 1:]
+        else:
+            # A strided view, since reshaping the column slice would copy the whole file
+            inner = np.empty(self.shape, dtype=self.dtype).strides
+            w = np.ndarray((self.rows,) + self.shape, dtype=self.dtype, buffer=self.target,
+                           offset=self.target.dtype.itemsize, strides=(self.target.strides[0],) + inner)
+        return self.target[:, 0], w
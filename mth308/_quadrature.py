@@ -0,0 +1,130 @@
+"""
+Shared helpers for evaluating quadrature rules on uniform node grids.
+"""
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+# Default number of nodes evaluated per call of f in vectorized mode
+CHUNK_SIZE = 2**16
+
+
+def trapezoid_weights(i, N):
+    """Trapezoidal weights (without the factor h) for node indices i of an N-interval grid."""
+    w = np.ones(i.shape)
+    w[(i == 0) | (i == N)] = 0.5
+    return w
+
+
+def simpson_weights(i, N):
+    """Simpson 1/3 weights (without the factor h/3) for node indices i of an N-interval grid."""
+    w = np.where(i % 2 == 1, 4.0, 2.0)
+    w[(i == 0) | (i == N)] = 1.0
+    return w
+
+
+def eval_vectorized(f, x):
+    """Return f(x) as an array of shape x.shape, or None if f does not accept arrays."""
+    try:
+        fx = f(x)
+    except (TypeError, ValueError):
+        return None
+    fx = np.asarray(fx, dtype=float) if fx is not None else None
+    if fx is None or fx.shape != x.shape:
+        return None
+    return fx
+
+
+def grid_dot(f, a, h, weights, start, stop, N, chunk_size=CHUNK_SIZE):
+    """
+    Compute sum_i w_i f(a + i h) over node indices start <= i < stop.
+
+    f is called on arrays of at most chunk_size nodes and each chunk is reduced
+    with a single dot product, so the peak memory is O(chunk_size). Returns None
+    if f cannot be evaluated on arrays.
+    """
+    total = 0.0
+    for lo in range(start, stop, chunk_size):
+        i = np.arange(lo, min(lo + chunk_size, stop))
+        fx = eval_vectorized(f, a + i * h)
+        if fx is None:
+            return None
+        total += np.dot(weights(i, N), fx)
+    return total
+
+
+def batched_grid_dot(f, a, h, weights, N, params, chunk_size=CHUNK_SIZE):
+    """
+    Compute sum_i w_i f(a + i h; theta_p) over the whole grid for every parameter set p.
+
+    params is a 1D array of parameter values, or a tuple of equal-length 1D
+    arrays for several parameters. f is called as f(x, *theta) with the nodes x
+    of shape (1, M) and each parameter of shape (P, 1), and must return a (P, M)
+    block (or anything broadcastable to it). Parameters and nodes are both
+    chunked so a block holds about chunk_size values, and each block is reduced
+    with one matrix-vector product.
+    """
+    if not isinstance(params, tuple):
+        params = (params,)
+    params = tuple(np.asarray(p, dtype=float) for p in params)
+    P = len(params[0])
+    if any(p.ndim != 1 or len(p) != P for p in params):
+        raise ValueError("params must be a 1D array or a tuple of 1D arrays of the same length.")
+
+    node_step = max(1, min(N + 1, chunk_size))
+    param_step = max(1, chunk_size // node_step)
+    out = np.zeros(P)
+    for p0 in range(0, P, param_step):
+        theta = [p[p0:p0 + param_step, None] for p in params]
+        for lo in range(0, N + 1, node_step):
+            i = np.arange(lo, min(lo + node_step, N + 1))
+            shape = (len(theta[0]), len(i))
+            F = np.asarray(f(a + i[None, :] * h, *theta), dtype=float)
+            try:
+                F = np.broadcast_to(F, shape)
+            except ValueError:
+                raise ValueError(f"f must return a block of shape {shape}, got {F.shape}.") from None
+            out[p0:p0 + param_step] += F @ weights(i, N)
+    return out
+
+
+def neumaier_sum(values):
+    """Sum an iterable of floats with Neumaier's compensated summation."""
+    total = 0.0
+    comp = 0.0
+    for v in values:
+        v = float(v)
+        t = total + v
+        if abs(total) >= abs(v):
+            comp += (total - t) + v
+        else:
+            comp += (v - t) + total
+        total = t
+    return total + comp
+
+
+def _panel_sum(f, a, h, weights, start, stop, N, vectorized):
+    """Weighted sum of f over node indices start <= i < stop (runs in a worker process)."""
+    i = np.arange(start, stop)
+    w = weights(i, N)
+    fx = eval_vectorized(f, a + i * h) if vectorized else None
+    if fx is None:
+        fx = (f(a + k * h) for k in range(start, stop))
+    return neumaier_sum(wk * fk for wk, fk in zip(w, fx))
+
+
+def parallel_grid_sum(f, a, h, weights, N, n_workers, chunk_size=CHUNK_SIZE, vectorized=False):
+    """
+    Compute sum_i w_i f(a + i h) over the whole grid on a process pool.
+
+    The node indices are split into panels of at most chunk_size nodes (and at
+    least four panels per worker, for load balancing). Each panel is summed in a
+    worker and the partial sums are combined with Neumaier summation, so the
+    result agrees with the serial loop to rounding. f must be picklable, i.e.
+    defined at module level.
+    """
+    panel = max(1, min(chunk_size, -(-(N + 1) // (4 * n_workers))))
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [pool.submit(_panel_sum, f, a, h, weights, lo, min(lo + panel, N + 1), N, vectorized)
+                   for lo in range(0, N + 1, panel)]
+        return neumaier_sum(fut.result() for fut in futures)
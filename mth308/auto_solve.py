@@ -0,0 +1,213 @@
+"""
+auto_solve.py
+
+A single entry point for solving linear systems Ax = b.
+
+Provides:
+    - inspect_matrix: Cheap structural inspection of a square matrix.
+    - solve: Inspect A and route the system to the fastest suitable solver.
+
+Example:
+    >>> from mth308 import solve
+    >>> x, info = solve([[4, 1], [2, 3]], [1, 2])
+    >>> print(info['method'], '-', info['reason'])
+"""
+import hashlib
+from collections import OrderedDict
+
+import numpy as np
+
+from .banded import bandwidth, banded_solve, to_banded, tridiagonal_solve
+from .cholesky import cholesky
+from .jacobi import block_jacobi
+from .lu import lu_pivot, lu_solve
+
+# Systems whose band (l + u + 1) is at most this fraction of n use the O(n) banded path.
+BANDED_MAX_FRACTION = 0.25
+
+# Diagonally dominant systems at least this large go to block Jacobi: a few
+# O(n^2) sweeps beat an O(n^3) factorization.
+ITERATIVE_MIN_N = 200
+
+_CACHE_SIZE = 32
+_inspection_cache = OrderedDict()
+
+
+def _matrix_key(A):
+    digest = hashlib.blake2b(np.ascontiguousarray(A).view(np.uint8), digest_size=16)
+    return A.shape, A.dtype.str, digest.hexdigest()
+
+
+def inspect_matrix(A):
+    """
+    Inspect the structure of a square matrix.
+
+    The result is cached (up to 32 matrices) on a hash of the matrix contents, so
+    repeated solves with the same A only pay for hashing.
+
+    Parameters
+    ----------
+    A : array_like
+        Square matrix (n x n).
+
+    Returns
+    -------
+    info : dict
+        Dictionary with keys 'n', 'density' (fraction of nonzero entries),
+        'lower_bandwidth', 'upper_bandwidth', 'symmetric', 'diagonally_dominant'
+        (strictly, by rows), 'positive_diagonal' and 'zero_diagonal'.
+
+    Raises
+    ------
+    ValueError
+        If A is not a square matrix.
+    """
+    A = np.asarray(A, dtype=float)
+    if A.ndim != 2 or A.shape[0] != A.shape[1]:
+        raise ValueError("A must be a square matrix.")
+    n = A.shape[0]
+
+    key = _matrix_key(A)
+    if key in _inspection_cache:
+        _inspection_cache.move_to_end(key)
+        return dict(_inspection_cache[key])
+
+    l, u = bandwidth(A)
+    diag = np.diag(A)
+    off_diag = np.abs(A).sum(axis=1) - np.abs(diag)
+
+    info = {
+        'n': n,
+        'density': float(np.count_nonzero(A)) / (n * n) if n else 0.0,
+        'lower_bandwidth': l,
+        'upper_bandwidth': u,
+        'symmetric': bool(np.array_equal(A, A.T)),
+        'diagonally_dominant': bool(np.all(np.abs(diag) > off_diag)),
+        'positive_diagonal': bool(np.all(diag > 0)),
+        'zero_diagonal': bool(np.any(diag == 0)),
+    }
+
+    _inspection_cache[key] = info
+    if len(_inspection_cache) > _CACHE_SIZE:
+        _inspection_cache.popitem(last=False)
+    return dict(info)
+
+
+def _choose_method(info, n_rhs):
+    """Return (method, reason) for a system with the given inspection info."""
+    l, u = info['lower_bandwidth'], info['upper_bandwidth']
+    if l <= 1 and u <= 1 and info['diagonally_dominant']:
+        return 'tridiagonal_solve', "diagonally dominant tridiagonal matrix: O(n) elimination without pivoting"
+    if l + u + 1 <= BANDED_MAX_FRACTION * info['n']:
+        return 'banded_solve', f"banded matrix (l = {l}, u = {u}): O(n (l+u)^2) banded LU with partial pivoting"
+    if n_rhs == 1 and info['diagonally_dominant'] and info['n'] >= ITERATIVE_MIN_N:
+        return 'block_jacobi', (f"strictly diagonally dominant with n = {info['n']} >= {ITERATIVE_MIN_N}: "
+                                "Jacobi sweeps are guaranteed to converge and cost O(n^2) each")
+    if info['symmetric'] and info['positive_diagonal']:
+        return 'cholesky', "symmetric with positive diagonal: Cholesky factorization (half the work of LU)"
+    if info['zero_diagonal']:
+        return 'lu_pivot', "zero on the diagonal: LU with partial pivoting (row exchanges are required)"
+    return 'lu_pivot', "general matrix: LU with partial pivoting"
+
+
+def solve(A, b, tol=1e-10, max_iter=500, verbose=False):
+    """
+    Solve the linear system Ax = b, choosing the solver from the structure of A.
+
+    A is inspected once (size, sparsity, bandwidth, symmetry, diagonal dominance; see
+    inspect_matrix) and the system is routed to:
+
+        - tridiagonal_solve for diagonally dominant tridiagonal systems,
+        - banded_solve when the band is narrow compared to n,
+        - block_jacobi for large strictly diagonally dominant systems,
+        - cholesky for symmetric matrices with a positive diagonal,
+        - lu_pivot (dense LU with partial pivoting) otherwise.
+
+    If block_jacobi does not converge or cholesky fails, the system is solved with
+    lu_pivot and the fallback is recorded in the returned info.
+    Pivoting is what keeps small or zero diagonal entries from producing wrong
+    answers, so the unpivoted lu_doolittle is not used here.
+
+    Parameters
+    ----------
+    A : array_like
+        Coefficient matrix (n x n).
+    b : array_like
+        Right-hand side of shape (n,) or (n, k).
+    tol : float, optional
+        Convergence tolerance for iterative solvers (default: 1e-10).
+    max_iter : int, optional
+        Maximum number of iterations for iterative solvers (default: 500).
+    verbose : bool, optional
+        If True, prints the chosen path and the reason.
+
+    Returns
+    -------
+    x : numpy.ndarray
+        Solution with the same shape as b.
+    info : dict
+        Dictionary with keys 'method' (the solver that produced x), 'reason',
+        'fallbacks' (list of methods that were tried first and failed) and
+        'inspection' (the result of inspect_matrix).
+
+    Raises
+    ------
+    ValueError
+        If the dimensions do not match or the system has no unique solution.
+
+    Example
+    -------
+    >>> x, info = solve([[4, 1], [2, 3]], [1, 2])
+    >>> info['method']
+    'tridiagonal_solve'
+    """
+    A = np.asarray(A, dtype=float)
+    b = np.array(b, dtype=float)
+    inspection = inspect_matrix(A)
+    n = inspection['n']
+    if b.shape[0] != n or b.ndim > 2:
+        raise ValueError("b must have shape (n,) or (n, k).")
+
+    method, reason = _choose_method(inspection, 1 if b.ndim == 1 else b.shape[1])
+    if verbose:
+        print(f"solve: using {method} ({reason})")
+    fallbacks = []
+
+    x = None
+    if method == 'tridiagonal_solve':
+        x = tridiagonal_solve(np.diag(A, -1), np.diag(A), np.diag(A, 1), b)
+    if method == 'block_jacobi':
+        x, iterations, converged = block_jacobi(A, b, max_iter=max_iter, tol=tol)
+        if not converged:
+            fallbacks.append(method)
+            method, reason, x = 'lu_pivot', f"block_jacobi did not converge in {iterations} iterations", None
+    if method == 'cholesky':
+        try:
+            x = cholesky(A).solve(b)
+        except ValueError as e:
+            fallbacks.append(method)
+            method, reason = 'lu_pivot', f"cholesky failed: {e}"
+    try:
+        if method == 'banded_solve':
+            l, u = inspection['lower_bandwidth'], inspection['upper_bandwidth']
+            x = banded_solve(to_banded(A, l, u), b, l, u)
+        if method == 'lu_pivot':
+            L, U, perm = lu_pivot(A)
+            x = lu_solve(L, U, b, perm)
+    except ValueError as e:
+        raise ValueError(f"No unique solution exists: {e}") from e
+
+    if verbose and fallbacks:
+        print(f"solve: fell back to {method} ({reason})")
+    return x, {'method': method, 'reason': reason, 'fallbacks': fallbacks, 'inspection': inspection}
+
+
+# Example demonstration
+if __name__ == "__main__":
+    A = np.array([[4.0, 1.0, 0.0],
+                  [1.0, 4.0, 1.0],
+                  [0.0, 1.0, 4.0]])
+    b = np.array([5.0, 6.0, 5.0])
+    x, info = solve(A, b, verbose=True)
+    print("Solution:", x)
+    print("Inspection:", info['inspection'])
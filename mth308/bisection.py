@@ -1,5 +1,8 @@
 import math
-def bisection_method(f, a, b, N=100, eps=1e-7, verbose=False):
+import time
+
+
+def bisection_method(f, a, b, N=100, eps=1e-7, verbose=False, callback=None, return_result=False):
     """
     Find a root of the equation f(x) = 0 in the interval [a, b] using the bisection method.
 
@@ -10,22 +13,35 @@ def bisection_method(f, a, b, N=100, eps=1e-7, verbose=False):
         N (int): Maximum number of iterations (default: 100).
         eps (float): Tolerance for stopping criterion (default: 1e-7).
         verbose (bool): If True, prints iteration details.
+        callback (callable, optional): Called as callback(k, x_k, f(x_k)) after every iteration,
+            e.g. an IterationProfiler.
+        return_result (bool): If True, return a SolverResult instead of the tuple below.
 
     Returns:
         root (float): The approximate root found.
         iterations (int): Number of iterations performed.
         converged (bool): Whether the method converged within the given tolerance.
     """
+    start = time.perf_counter()
+
+    def done(x, k, converged, y):
+        # Two evaluations at the end points and one per iteration
+        if return_result:
+            from .result import CONVERGED, MAX_ITER, SolverResult
+            return SolverResult(x, k, 2 + k, time.perf_counter() - start, abs(y),
+                                CONVERGED if converged else MAX_ITER)
+        return x, k, converged
+
     y_0 = f(a)
     y_1 = f(b)
     if y_0 == 0:
         if verbose:
             print(f"\nA root of the given equation is {a:.9f}.")
-        return a, 0, True
+        return done(a, 0, True, y_0)
     if y_1 == 0:
         if verbose:
             print(f"\nA root of the given equation is {b:.9f}.")
-        return b, 0, True
+        return done(b, 0, True, y_1)
     if y_0 * y_1 > 0:
         raise ValueError(f"Bisection method cannot locate any root in the interval [{a}, {b}]. f(a) and f(b) must have opposite signs.")
 
@@ -38,15 +54,17 @@ def bisection_method(f, a, b, N=100, eps=1e-7, verbose=False):
         y = f(x)
         if verbose:
             print(f"{k:4d}  {a:12.9f}  {b:12.9f}  {x:12.9f}  {y:12.9f}")
+        if callback is not None:
+            callback(k, x, y)
         if y == 0 or (b - a) <= eps:
-            return x, k, True
+            return done(x, k, True, y)
         if y_0 * y > 0:
             a = x
             y_0 = y
         else:
             b = x
         k += 1
-    return x, N, False
+    return done(x, N, False, y)
 
 def f(x):
     """Example function: sqrt(x) - cos(x)"""
@@ -0,0 +1,354 @@
+"""
+cholesky.py
+
+Cholesky (A = L L^T) and LDL^T factorizations for symmetric matrices.
+
+Both factorizations read only the lower triangle of A and keep the factor as a
+single packed lower triangle: row i of L occupies packed[i(i+1)/2 : i(i+1)/2 + i + 1].
+The returned factor objects solve for any number of right-hand sides.
+
+Provides:
+    - cholesky: Blocked Cholesky factorization of a symmetric positive-definite matrix.
+    - ldl: LDL^T factorization of a symmetric (possibly indefinite) matrix.
+    - is_positive_definite: Cheap fail-fast check for symmetric positive definiteness.
+    - CholeskyFactor, LDLFactor: Packed factors with a solve method.
+
+Example:
+    >>> from cholesky import cholesky
+    >>> factor = cholesky([[4, 2], [2, 3]])
+    >>> print(factor.solve([6, 5]))
+"""
+import numpy as np
+
+
+def _pack_lower(W):
+    """Copy the lower triangle of W row by row into a packed 1D array."""
+    n = W.shape[0]
+    packed = np.empty(n * (n + 1) // 2)
+    for i in range(n):
+        off = i * (i + 1) // 2
+        packed[off:off + i + 1] = W[i, :i + 1]
+    return packed
+
+
+def _unpack_lower(packed, n):
+    L = np.zeros((n, n))
+    for i in range(n):
+        off = i * (i + 1) // 2
+        L[i, :i + 1] = packed[off:off + i + 1]
+    return L
+
+
+def _forward(packed, y, unit):
+    """Solve L z = y in place (rows of L are contiguous in packed storage)."""
+    for i in range(len(y)):
+        off = i * (i + 1) // 2
+        y[i] -= packed[off:off + i] @ y[:i]
+        if not unit:
+            y[i] /= packed[off + i]
+
+
+def _backward(packed, y, unit):
+    """Solve L^T z = y in place, sweeping with row i of L (column i of L^T)."""
+    for i in range(len(y) - 1, -1, -1):
+        off = i * (i + 1) // 2
+        if not unit:
+            y[i] /= packed[off + i]
+        y[:i] -= np.multiply.outer(packed[off:off + i], y[i])
+
+
+def _check_rhs(b, n):
+    b = np.array(b, dtype=float)
+    if b.shape[0] != n or b.ndim > 2:
+        raise ValueError("b must have shape (n,) or (n, k).")
+    return b
+
+
+class CholeskyFactor:
+    """
+    Cholesky factor A = L L^T stored as a packed lower triangle.
+
+    Attributes
+    ----------
+    n : int
+        Order of the matrix.
+    packed : numpy.ndarray
+        Lower triangle of L, packed row by row (length n(n+1)/2).
+    """
+    __slots__ = ('n', 'packed')
+
+    def __init__(self, packed, n):
+        self.packed = packed
+        self.n = n
+
+    @property
+    def L(self):
+        """The dense lower triangular factor (n x n)."""
+        return _unpack_lower(self.packed, self.n)
+
+    def diagonal(self):
+        """Return the diagonal of L."""
+        i = np.arange(self.n)
+        return self.packed[i * (i + 1) // 2 + i]
+
+    def logdet(self):
+        """Return log(det(A)) = 2 * sum(log(diag(L)))."""
+        return 2.0 * np.sum(np.log(self.diagonal()))
+
+    def solve(self, b):
+        """
+        Solve Ax = b with the stored factor.
+
+        Parameters
+        ----------
+        b : array_like
+            Right-hand side of shape (n,) or (n, k).
+
+        Returns
+        -------
+        x : numpy.ndarray
+            Solution with the same shape as b.
+        """
+        x = _check_rhs(b, self.n)
+        _forward(self.packed, x, unit=False)
+        _backward(self.packed, x, unit=False)
+        return x
+
+
+class LDLFactor:
+    """
+    Factorization A = L D L^T with unit lower triangular L and diagonal D.
+
+    L (below the diagonal) and D (on the diagonal) share one packed lower triangle.
+
+    Attributes
+    ----------
+    n : int
+        Order of the matrix.
+    packed : numpy.ndarray
+        Strict lower triangle of L with D on the diagonal, packed row by row.
+    """
+    __slots__ = ('n', 'packed')
+
+    def __init__(self, packed, n):
+        self.packed = packed
+        self.n = n
+
+    @property
+    def D(self):
+        """The diagonal of D (n,)."""
+        i = np.arange(self.n)
+        return self.packed[i * (i + 1) // 2 + i]
+
+    @property
+    def L(self):
+        """The dense unit lower triangular factor (n x n)."""
+        L = _unpack_lower(self.packed, self.n)
+        np.fill_diagonal(L, 1.0)
+        return L
+
+    def inertia(self):
+        """Return the number of (positive, negative, zero) eigenvalues of A."""
+        D = self.D
+        return int(np.sum(D > 0)), int(np.sum(D < 0)), int(np.sum(D == 0))
+
+    def solve(self, b):
+        """
+        Solve Ax = b with the stored factor.
+
+        Parameters
+        ----------
+        b : array_like
+            Right-hand side of shape (n,) or (n, k).
+
+        Returns
+        -------
+        x : numpy.ndarray
+            Solution with the same shape as b.
+        """
+        x = _check_rhs(b, self.n)
+        _forward(self.packed, x, unit=True)
+        x /= self.D if x.ndim == 1 else self.D[:, None]
+        _backward(self.packed, x, unit=True)
+        return x
+
+
+def _cholesky_unblocked(a):
+    """Factor the lower triangle of the square view a in place."""
+    for j in range(a.shape[0]):
+        d = a[j, j] - a[j, :j] @ a[j, :j]
+        if not d > 0:
+            raise ValueError("Matrix is not positive definite.")
+        a[j, j] = np.sqrt(d)
+        a[j + 1:, j] = (a[j + 1:, j] - a[j + 1:, :j] @ a[j, :j]) / a[j, j]
+
+
+def cholesky(A, block_size=64, overwrite_a=False):
+    """
+    Compute the Cholesky factorization A = L L^T of a symmetric positive-definite matrix.
+
+    A right-looking blocked algorithm is used: each diagonal block is factored
+    directly, the panel below it is obtained by a triangular solve and the trailing
+    lower triangle is updated block column by block column with matrix products.
+    Only the lower triangle of A is read. The factorization stops at the first
+    non-positive pivot.
+
+    Parameters
+    ----------
+    A : array_like
+        Symmetric positive-definite matrix (n x n).
+    block_size : int, optional
+        Order of the diagonal blocks (default: 64).
+    overwrite_a : bool, optional
+        If True and A is a float ndarray, A is used as the work array and its
+        contents are destroyed, which avoids an n x n copy.
+
+    Returns
+    -------
+    factor : CholeskyFactor
+        The factor L in packed storage.
+
+    Raises
+    ------
+    ValueError
+        If A is not square or not positive definite.
+
+    Example
+    -------
+    >>> factor = cholesky([[4, 2], [2, 3]])
+    >>> factor.solve([6, 5])
+    array([1., 1.])
+    """
+    if overwrite_a and isinstance(A, np.ndarray) and A.dtype == float:
+        W = A
+    else:
+        W = np.array(A, dtype=float)
+    n = W.shape[0]
+    if W.shape != (n, n):
+        raise ValueError("A must be a square matrix.")
+    nb = max(1, int(block_size))
+
+    for k in range(0, n, nb):
+        e = min(k + nb, n)
+        _cholesky_unblocked(W[k:e, k:e])
+        if e == n:
+            break
+        L11 = np.tril(W[k:e, k:e])
+        W[e:, k:e] = np.linalg.solve(L11, W[e:, k:e].T).T
+        panel = W[e:, k:e]
+        # Update only the lower triangle of the trailing matrix
+        for j in range(e, n, nb):
+            f = min(j + nb, n)
+            W[j:, j:f] -= panel[j - e:] @ panel[j - e:f - e].T
+
+    return CholeskyFactor(_pack_lower(W), n)
+
+
+def ldl(A, overwrite_a=False):
+    """
+    Compute the factorization A = L D L^T of a symmetric matrix.
+
+    Unlike cholesky, D may have negative entries, so symmetric indefinite matrices
+    are accepted. No pivoting is performed: the factorization fails if a zero pivot
+    appears. Only the lower triangle of A is read.
+
+    Parameters
+    ----------
+    A : array_like
+        Symmetric matrix (n x n).
+    overwrite_a : bool, optional
+        If True and A is a float ndarray, A is used as the work array.
+
+    Returns
+    -------
+    factor : LDLFactor
+        The factors L and D in packed storage.
+
+    Raises
+    ------
+    ValueError
+        If A is not square or a zero pivot is encountered.
+
+    Example
+    -------
+    >>> factor = ldl([[1, 2], [2, 1]])
+    >>> factor.D
+    array([ 1., -3.])
+    """
+    if overwrite_a and isinstance(A, np.ndarray) and A.dtype == float:
+        W = A
+    else:
+        W = np.array(A, dtype=float)
+    n = W.shape[0]
+    if W.shape != (n, n):
+        raise ValueError("A must be a square matrix.")
+
+    d = np.empty(n)
+    for j in range(n):
+        v = W[j, :j] * d[:j]
+        d[j] = W[j, j] - W[j, :j] @ v
+        if d[j] == 0:
+            raise ValueError("Zero pivot encountered in LDL^T factorization.")
+        W[j + 1:, j] = (W[j + 1:, j] - W[j + 1:, :j] @ v) / d[j]
+        W[j, j] = d[j]
+
+    return LDLFactor(_pack_lower(W), n)
+
+
+def is_positive_definite(A, block_size=64):
+    """
+    Check whether a matrix is symmetric positive definite.
+
+    Cheap necessary conditions are tested first (square, symmetric, positive
+    diagonal, |a_ij| < sqrt(a_ii a_jj)); only then is a Cholesky factorization
+    attempted, which stops at the first non-positive pivot.
+
+    Parameters
+    ----------
+    A : array_like
+        Square matrix (n x n).
+    block_size : int, optional
+        Block size passed to cholesky (default: 64).
+
+    Returns
+    -------
+    bool
+        True if A is symmetric positive definite.
+    """
+    A = np.asarray(A, dtype=float)
+    n = A.shape[0]
+    if A.ndim != 2 or A.shape != (n, n) or not np.array_equal(A, A.T):
+        return False
+    diag = np.diag(A)
+    if np.any(diag <= 0):
+        return False
+    scale = np.sqrt(diag)
+    C = np.abs(A) / scale[:, None] / scale[None, :]
+    np.fill_diagonal(C, 0.0)
+    if np.any(C >= 1):
+        return False
+    try:
+        cholesky(A, block_size=block_size)
+    except ValueError:
+        return False
+    return True
+
+
+# Example demonstration
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    n = 500
+    B = rng.normal(size=(n, n))
+    A = B @ B.T + n * np.eye(n)
+    b = rng.normal(size=n)
+
+    factor = cholesky(A)
+    x = factor.solve(b)
+    print(f"Cholesky: n = {n}, packed length = {factor.packed.size}, residual = {np.max(np.abs(A @ x - b)):.2e}")
+    print("log det(A):", factor.logdet())
+    print("Positive definite:", is_positive_definite(A))
+
+    S = np.array([[1.0, 2.0], [2.0, 1.0]])
+    f = ldl(S)
+    print("\nLDL^T of [[1, 2], [2, 1]]: D =", f.D, ", inertia =", f.inertia())
+    print("Positive definite:", is_positive_definite(S))
@@ -0,0 +1,348 @@
+"""
+cubature.py
+
+Integration over boxes in several dimensions.
+
+Tensor-product cubature combines a 1D rule (trapezoidal, Simpson or
+Gauss-Legendre) in every direction; its cost grows like n^d, so it suits smooth
+integrands in 2-4 dimensions. Quasi-Monte Carlo integration averages f over a
+low-discrepancy sequence (Sobol or Halton); its error decays almost like 1/n
+independently of the dimension. Randomly shifted replicas of the sequence give a
+running error estimate.
+
+In both methods the points are generated and evaluated in chunks of flat
+indices, so memory stays bounded and f is called on whole arrays of points.
+
+Provides:
+    - tensor_cubature: Tensor-product trapezoidal, Simpson or Gauss-Legendre cubature.
+    - sobol: Points of the Sobol sequence (up to 10 dimensions).
+    - halton: Points of the Halton sequence.
+    - qmc_integrate: Randomized quasi-Monte Carlo integration with an error estimate.
+
+Example:
+    >>> import numpy as np
+    >>> from cubature import tensor_cubature
+    >>> print(tensor_cubature(lambda x, y: np.exp(x + y), [(0, 1), (0, 1)], n=8))
+"""
+import numpy as np
+
+from ._quadrature import CHUNK_SIZE
+from .gauss_legendre import gauss_legendre_nodes
+
+# Joe-Kuo direction numbers (s, a, m_1..m_s) for Sobol dimensions 2 to 10
+_SOBOL_PARAMS = [
+    (1, 0, [1]),
+    (2, 1, [1, 3]),
+    (3, 1, [1, 3, 1]),
+    (3, 2, [1, 1, 1]),
+    (4, 1, [1, 1, 3, 3]),
+    (4, 4, [1, 3, 5, 13]),
+    (5, 2, [1, 1, 5, 5, 17]),
+    (5, 4, [1, 1, 5, 5, 5]),
+    (5, 7, [1, 1, 7, 11, 19]),
+]
+_SOBOL_BITS = 32
+
+_PRIMES = [2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53, 59, 61, 67, 71]
+
+
+def _check_bounds(bounds):
+    bounds = np.array(bounds, dtype=float)
+    if bounds.ndim != 2 or bounds.shape[1] != 2 or len(bounds) < 1:
+        raise ValueError("bounds must be a sequence of (lower, upper) pairs.")
+    return bounds[:, 0], bounds[:, 1]
+
+
+def _evaluate(f, coords):
+    """Evaluate f(*coords) on arrays of points, falling back to one point at a time."""
+    try:
+        fx = np.asarray(f(*coords), dtype=float)
+        if fx.shape == coords[0].shape:
+            return fx
+    except (TypeError, ValueError):
+        pass
+    return np.array([f(*p) for p in zip(*coords)], dtype=float)
+
+
+def _rule_1d(rule, n, a, b):
+    """Nodes and weights of a 1D rule on [a, b]."""
+    if rule == 'gauss':
+        x, w = gauss_legendre_nodes(n)
+        half = (b - a) / 2
+        return a + half * (x + 1), half * w
+    h = (b - a) / n
+    x = a + h * np.arange(n + 1)
+    if rule == 'trapezoid':
+        w = np.full(n + 1, h)
+        w[[0, -1]] = h / 2
+    elif rule == 'simpson':
+        if n % 2:
+            raise ValueError("n must be even for Simpson's rule.")
+        w = np.where(np.arange(n + 1) % 2 == 1, 4 * h / 3, 2 * h / 3)
+        w[[0, -1]] = h / 3
+    else:
+        raise ValueError("rule must be 'trapezoid', 'simpson' or 'gauss'.")
+    return x, w
+
+
+def tensor_cubature(f, bounds, n=10, rule='gauss', chunk_size=CHUNK_SIZE):
+    """
+    Integrate f over a box with a tensor-product rule.
+
+    The 1D rule is applied in every direction, giving prod(n_k) points (n_k + 1
+    for the trapezoidal and Simpson rules). The points are enumerated by flat
+    index in chunks of chunk_size; f receives one coordinate array per dimension,
+    e.g. f(x, y, z) for a 3D box, and each chunk is reduced with a dot product
+    against the product weights.
+
+    Parameters
+    ----------
+    f : callable
+        The integrand f(x_1, ..., x_d). It should accept arrays; otherwise it is
+        evaluated one point at a time.
+    bounds : sequence of (float, float)
+        Lower and upper limit in each dimension.
+    n : int or sequence of int, optional
+        Number of nodes ('gauss') or sub-intervals ('trapezoid', 'simpson') per
+        dimension (default: 10).
+    rule : {'gauss', 'trapezoid', 'simpson'}, optional
+        The 1D rule (default: 'gauss').
+    chunk_size : int, optional
+        Number of points per call of f (default: 65536).
+
+    Returns
+    -------
+    float
+        Approximation of the integral.
+
+    Raises
+    ------
+    ValueError
+        If the bounds, n or rule are invalid.
+
+    Example
+    -------
+    >>> tensor_cubature(lambda x, y: x * y**2, [(0, 1), (0, 3)], n=2, rule='simpson')
+    4.5
+    """
+    a, b = _check_bounds(bounds)
+    d = len(a)
+    n = np.broadcast_to(np.asarray(n, dtype=int), (d,))
+    nodes, weights = zip(*(_rule_1d(rule, int(n[k]), a[k], b[k]) for k in range(d)))
+    shape = tuple(len(x) for x in nodes)
+
+    total = 0.0
+    size = int(np.prod(shape))
+    for start in range(0, size, chunk_size):
+        idx = np.unravel_index(np.arange(start, min(start + chunk_size, size)), shape)
+        coords = [nodes[k][idx[k]] for k in range(d)]
+        w = weights[0][idx[0]]
+        for k in range(1, d):
+            w = w * weights[k][idx[k]]
+        total += np.dot(w, _evaluate(f, coords))
+    return total
+
+
+def _sobol_directions(d):
+    """Direction numbers V[j, k] (as 32-bit integers) for the first d Sobol dimensions."""
+    V = np.zeros((d, _SOBOL_BITS), dtype=np.uint64)
+    V[0] = [1 << (_SOBOL_BITS - 1 - k) for k in range(_SOBOL_BITS)]
+    for j in range(1, d):
+        s, a, m = _SOBOL_PARAMS[j - 1]
+        v = [m[k] << (_SOBOL_BITS - 1 - k) for k in range(s)]
+        for k in range(s, _SOBOL_BITS):
+            vk = v[k - s] ^ (v[k - s] >> s)
+            for l in range(1, s):
+                if (a >> (s - 1 - l)) & 1:
+                    vk ^= v[k - l]
+            v.append(vk)
+        V[j] = v
+    return V
+
+
+def sobol(n, d, start=0):
+    """
+    Compute points start, ..., start + n - 1 of the d-dimensional Sobol sequence.
+
+    Point i is the XOR of the direction numbers selected by the bits of the Gray
+    code of i, computed for all points at once (one pass per bit), so any block
+    of the sequence can be generated independently.
+
+    Parameters
+    ----------
+    n : int
+        Number of points.
+    d : int
+        Dimension (1 <= d <= 10).
+    start : int, optional
+        Index of the first point (default: 0).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n, d) with points in [0, 1)^d.
+
+    Example
+    -------
+    >>> sobol(4, 2)
+    array([[0.  , 0.  ],
+           [0.5 , 0.5 ],
+           [0.75, 0.25],
+           [0.25, 0.75]])
+    """
+    if not 1 <= d <= len(_SOBOL_PARAMS) + 1:
+        raise ValueError(f"d must be between 1 and {len(_SOBOL_PARAMS) + 1}.")
+    V = _sobol_directions(d)
+    i = np.arange(start, start + n, dtype=np.uint64)
+    gray = i ^ (i >> np.uint64(1))
+    X = np.zeros((n, d), dtype=np.uint64)
+    for k in range(_SOBOL_BITS):
+        bit = ((gray >> np.uint64(k)) & np.uint64(1)).astype(bool)
+        X[bit] ^= V[:, k]
+    return X / float(2**_SOBOL_BITS)
+
+
+def halton(n, d, start=1):
+    """
+    Compute points start, ..., start + n - 1 of the d-dimensional Halton sequence.
+
+    Coordinate j of point i is the radical inverse of i in the j-th prime base.
+
+    Parameters
+    ----------
+    n : int
+        Number of points.
+    d : int
+        Dimension (1 <= d <= 20).
+    start : int, optional
+        Index of the first point (default: 1, skipping the origin).
+
+    Returns
+    -------
+    numpy.ndarray
+        Array of shape (n, d) with points in [0, 1)^d.
+
+    Example
+    -------
+    >>> halton(3, 2)
+    array([[0.5       , 0.33333333],
+           [0.25      , 0.66666667],
+           [0.75      , 0.11111111]])
+    """
+    if not 1 <= d <= len(_PRIMES):
+        raise ValueError(f"d must be between 1 and {len(_PRIMES)}.")
+    X = np.zeros((n, d))
+    for j, p in enumerate(_PRIMES[:d]):
+        i = np.arange(start, start + n)
+        scale = 1.0 / p
+        while np.any(i > 0):
+            X[:, j] += (i % p) * scale
+            i //= p
+            scale /= p
+    return X
+
+
+def qmc_integrate(f, bounds, n=2**16, method='sobol', replicas=8, tol=None,
+                  batch_size=2**13, seed=None):
+    """
+    Integrate f over a box with randomized quasi-Monte Carlo.
+
+    The low-discrepancy points are shifted by replicas independent random
+    vectors (modulo 1). Each replica gives an unbiased estimate; their mean is
+    the result and the standard error of the mean estimates its error. Points are
+    generated and evaluated in batches of batch_size per replica, and the
+    estimate is updated after every batch, so the integration can stop as soon
+    as the error estimate falls below tol.
+
+    Parameters
+    ----------
+    f : callable
+        The integrand f(x_1, ..., x_d). It should accept arrays; otherwise it is
+        evaluated one point at a time.
+    bounds : sequence of (float, float)
+        Lower and upper limit in each dimension.
+    n : int, optional
+        Maximum number of points per replica (default: 2**16). Powers of two
+        suit the Sobol sequence best.
+    method : {'sobol', 'halton'}, optional
+        The low-discrepancy sequence (default: 'sobol').
+    replicas : int, optional
+        Number of random shifts, at least 2 (default: 8).
+    tol : float, optional
+        Stop when the error estimate is below tol (default: None, use all n points).
+    batch_size : int, optional
+        Number of points per replica and batch (default: 8192).
+    seed : int or numpy.random.Generator, optional
+        Seed for the random shifts.
+
+    Returns
+    -------
+    value : float
+        Approximation of the integral.
+    info : dict
+        'converged' (error below tol, or True if tol is None), 'error' (standard
+        error estimate), 'n_evals' (number of evaluations of f) and 'history'
+        (list of (n_evals, value, error) after every batch).
+
+    Example
+    -------
+    >>> value, info = qmc_integrate(lambda *x: np.prod(x, axis=0), [(0, 1)] * 4, seed=0)
+    >>> abs(value - 1 / 16) < 1e-4
+    True
+    """
+    a, b = _check_bounds(bounds)
+    d = len(a)
+    if method == 'sobol':
+        points, first = sobol, 0
+    elif method == 'halton':
+        points, first = halton, 1
+    else:
+        raise ValueError("method must be 'sobol' or 'halton'.")
+    if replicas < 2:
+        raise ValueError("replicas must be at least 2.")
+    rng = np.random.default_rng(seed)
+    shifts = rng.random((replicas, 1, d))
+    volume = float(np.prod(b - a))
+
+    sums = np.zeros(replicas)
+    count = 0
+    history = []
+    value = error = np.nan
+    while count < n:
+        m = min(batch_size, n - count)
+        U = (points(m, d, start=first + count)[None, :, :] + shifts) % 1.0
+        X = a + (b - a) * U.reshape(-1, d)
+        sums += _evaluate(f, list(X.T)).reshape(replicas, m).sum(axis=1)
+        count += m
+        estimates = volume * sums / count
+        value = float(np.mean(estimates))
+        error = float(np.std(estimates, ddof=1) / np.sqrt(replicas))
+        history.append((count * replicas, value, error))
+        if tol is not None and error < tol:
+            break
+
+    converged = tol is None or error < tol
+    return value, {'converged': converged, 'error': error, 'n_evals': count * replicas, 'history': history}
+
+
+# Example demonstration
+if __name__ == "__main__":
+    import time
+
+    # Smooth 3D integrand: exp(x + y + z) over the unit cube
+    f3 = lambda x, y, z: np.exp(x + y + z)
+    exact = (np.e - 1) ** 3
+    for rule, n in (('trapezoid', 40), ('simpson', 40), ('gauss', 8)):
+        approx = tensor_cubature(f3, [(0, 1)] * 3, n=n, rule=rule)
+        print(f"Tensor-product {rule:9s} (n = {n:2d}): error = {abs(approx - exact):.2e}")
+
+    # 6D integrand with QMC: prod_k (1 + (x_k - 1/2)) has integral 1
+    f6 = lambda *x: np.prod([1 + (xk - 0.5) for xk in x], axis=0)
+    for method in ('sobol', 'halton'):
+        start = time.perf_counter()
+        value, info = qmc_integrate(f6, [(0, 1)] * 6, n=2**16, method=method, seed=1)
+        print(f"QMC ({method}), 6D: value = {value:.8f}, estimated error = {info['error']:.1e}, "
+              f"{info['n_evals']} evaluations in {time.perf_counter() - start:.3f} s")
+
+    value, info = qmc_integrate(f6, [(0, 1)] * 6, n=2**20, tol=1e-5, seed=1)
+    print(f"QMC with tol = 1e-5: stopped after {info['n_evals']} evaluations (error {info['error']:.1e})")
@@ -26,15 +26,16 @@ def divided_difference_table(x, y):
      [ 4.  3.  0.]
      [16.  6.  1.]]
     """
+    x = np.asarray(x, dtype=float)
     n = len(x)
     table = np.zeros((n, n))
     table[:, 0] = y
 
-    for i in range(1, n):
-        for j in range(1, i+1):
-            numerator = table[i][j-1] - table[i-1][j-1]
-            denominator = x[i] - x[i-j]
-            table[i][j] = numerator / denominator
+    # Column j holds the j-th divided differences, one vectorized pass per column
+    for j in range(1, n):
+        numerator = table[j:, j-1] - table[j-1:n-1, j-1]
+        denominator = x[j:] - x[:n-j]
+        table[j:, j] = numerator / denominator
 
     return table
 
@@ -71,15 +72,223 @@ def newton_divided_diff(x, y):
     >>> newton_divided_diff(x, y)
     """
 
+    x = np.asarray(x, dtype=float)
     n = len(x)
     table = np.zeros((n, n))
     table[:, 0] = y  # Fill first column with y values
 
-    # Step-1: Fill divided difference table
-    for i in range(1, n):
-        for j in range(1, i+1):
-            numerator = table[i][j-1] - table[i-1][j-1]
-            denominator = x[i] - x[i-j]
-            table[i][j] = numerator / denominator
+    # Step-1: Fill divided difference table column by column
+    for j in range(1, n):
+        numerator = table[j:, j-1] - table[j-1:n-1, j-1]
+        denominator = x[j:] - x[:n-j]
+        table[j:, j] = numerator / denominator
 
     return table
+
+def newton_coefficients(x, y):
+    """
+    Compute only the Newton coefficients [F0,0, F1,1, ..., Fn,n] in O(n) memory.
+
+    A single length-n array is updated in place: after the j-th pass, entries j..n
+    hold the j-th divided differences, and entry j is final. Each pass is one
+    vectorized NumPy operation, so no n x n table is ever formed. Use
+    divided_difference_table when the full table is needed.
+
+    Parameters
+    ----------
+    x : array_like
+        1D array of distinct x data points [x0, x1, ..., xn].
+    y : array_like
+        1D array of corresponding y values f(x) = [f(x0), f(x1), ..., f(xn)].
+
+    Returns
+    -------
+    coef : numpy.ndarray
+        The diagonal of the divided difference table, i.e. the coefficients of
+        p(x) = F0,0 + F1,1 (x - x0) + ... + Fn,n (x - x0)...(x - x(n-1)).
+
+    Example
+    -------
+    >>> newton_coefficients([1, 2, 4], [1, 4, 16])
+    array([1., 3., 1.])
+    """
+    return _newton_passes(x, y)[0]
+
+def _newton_passes(x, y):
+    """Return the Newton coefficients and the last row of the divided difference table."""
+    x = np.asarray(x, dtype=float)
+    coef = np.array(y, dtype=float)
+    n = len(x)
+    if coef.shape != (n,):
+        raise ValueError("x and y must be 1D arrays of the same length.")
+    last = np.empty(n)
+    last[:1] = coef[-1:]
+    dx = np.empty(n)
+    for j in range(1, n):
+        np.subtract(x[j:], x[:n-j], out=dx[:n-j])
+        coef[j:] = (coef[j:] - coef[j-1:n-1]) / dx[:n-j]
+        last[j] = coef[-1]
+    return coef, last
+
+class NewtonInterpolant:
+    """
+    Interpolating polynomial in Newton form, evaluated by nested multiplication.
+
+    p(t) = c0 + (t - x0)(c1 + (t - x1)(c2 + ... + (t - x(n-1)) cn))
+
+    Nodes can be added one at a time with append. The interpolant keeps the last
+    row of the divided difference table, so each new node costs O(n) instead of
+    rebuilding the table.
+
+    Parameters
+    ----------
+    x : array_like, optional
+        1D array of distinct interpolation nodes [x0, x1, ..., xn]. If omitted, the
+        interpolant starts empty and is built with append.
+    y : array_like, optional
+        1D array of corresponding values [f(x0), f(x1), ..., f(xn)].
+
+    Attributes
+    ----------
+    nodes : numpy.ndarray
+        The interpolation nodes.
+    coef : numpy.ndarray
+        The Newton coefficients (see newton_coefficients).
+
+    Example
+    -------
+    >>> p = NewtonInterpolant([1, 2, 4], [1, 4, 16])
+    >>> p([3, 5])
+    array([ 9., 25.])
+    >>> p(3, der=1)
+    6.0
+    >>> p.append(3, 9)
+    >>> p.coef
+    array([1., 3., 1., 0.])
+    """
+
+    # Query points are processed in blocks of this size to stay cache friendly
+    chunk_size = 65536
+
+    def __init__(self, x=(), y=()):
+        x = np.array(x, dtype=float)
+        coef, last = _newton_passes(x, y)
+        self._n = len(x)
+        capacity = max(16, self._n)
+        self._x = np.empty(capacity)
+        self._c = np.empty(capacity)
+        self._last = np.empty(capacity)
+        self._x[:self._n] = x
+        self._c[:self._n] = coef
+        self._last[:self._n] = last
+
+    @property
+    def nodes(self):
+        """The interpolation nodes."""
+        return self._x[:self._n]
+
+    @property
+    def coef(self):
+        """The Newton coefficients."""
+        return self._c[:self._n]
+
+    def __len__(self):
+        return self._n
+
+    def append(self, xi, yi):
+        """
+        Add the node (xi, yi) and update the coefficients in O(n).
+
+        The new row of the divided difference table is built from the stored last
+        row: r[0] = yi and r[j] = (r[j-1] - last[j-1]) / (xi - x[n-j]). Its final
+        entry is the new coefficient, and it becomes the stored last row.
+
+        Parameters
+        ----------
+        xi : float
+            New node, distinct from the existing ones.
+        yi : float
+            Value at the new node.
+
+        Raises
+        ------
+        ValueError
+            If xi coincides with an existing node.
+        """
+        xi = float(xi)
+        n = self._n
+        x, last = self._x, self._last
+        if np.any(x[:n] == xi):
+            raise ValueError(f"Node {xi} is already present.")
+        if n == len(x):
+            for name in ('_x', '_c', '_last'):
+                grown = np.empty(2 * n)
+                grown[:n] = getattr(self, name)
+                setattr(self, name, grown)
+            x, last = self._x, self._last
+
+        r = float(yi)
+        for j in range(1, n + 1):
+            prev = last[j-1]
+            last[j-1] = r
+            r = (r - prev) / (xi - x[n-j])
+        last[n] = r
+        x[n] = xi
+        self._c[n] = r
+        self._n = n + 1
+
+    @property
+    def degree(self):
+        """Degree of the interpolating polynomial."""
+        return len(self.coef) - 1
+
+    def _horner(self, t, der):
+        x, c = self.nodes, self.coef
+        n = len(c)
+        if n == 0:
+            raise ValueError("The interpolant has no nodes.")
+        # p[m] holds the m-th derivative of the nested tail polynomial
+        p = [np.full(t.shape, c[-1])] + [np.zeros(t.shape) for _ in range(der)]
+        dt = np.empty(t.shape)
+        tmp = np.empty(t.shape)
+        for i in range(n - 2, -1, -1):
+            np.subtract(t, x[i], out=dt)
+            for m in range(min(der, n - 1 - i), 0, -1):
+                p[m] *= dt
+                np.multiply(p[m-1], m, out=tmp)
+                p[m] += tmp
+            p[0] *= dt
+            p[0] += c[i]
+        return p[der]
+
+    def __call__(self, t, der=0):
+        """
+        Evaluate the interpolant (or one of its derivatives) at the points t.
+
+        Parameters
+        ----------
+        t : array_like
+            Query points of any shape.
+        der : int, optional
+            Order of the derivative to evaluate (default: 0).
+
+        Returns
+        -------
+        numpy.ndarray or float
+            Values with the same shape as t.
+        """
+        t = np.asarray(t, dtype=float)
+        der = int(der)
+        if der < 0:
+            raise ValueError("der must be a non-negative integer.")
+        flat = t.ravel()
+        out = np.empty(flat.shape)
+        for start in range(0, flat.size, self.chunk_size):
+            stop = start + self.chunk_size
+            out[start:stop] = self._horner(flat[start:stop], der)
+        out = out.reshape(t.shape)
+        return out[()] if out.ndim == 0 else out
+
+    def derivative(self, t, order=1):
+        """Evaluate the derivative of the given order at t (same as p(t, der=order))."""
+        return self(t, der=order)
@@ -1,7 +1,9 @@
 import numpy as np
-import matplotlib.pyplot as plt
 
-def euler_method(f, a, b, y0, N=None, h=None):
+from ._ode_output import BLOCK_SIZE, OutputSink
+from .rk4 import _state_view
+
+def euler_method(f, a, b, y0, N=None, h=None, every=1, out=None, block_size=BLOCK_SIZE):
     """
     Solve an ODE using Euler's method on the interval [a,b].
     
@@ -15,19 +17,33 @@ def euler_method(f, a, b, y0, N=None, h=None):
         The starting point of the interval.
     b : float
         The end point of the interval.
-    y0 : float
-        Initial condition y(a) = y0.
+    y0 : float or array_like
+        Initial condition y(a) = y0. An array gives a system of ODEs; f then
+        receives and returns arrays of the same shape.
     N : int, optional
         Number of sub-intervals.
     h : float, optional
         Step size.
+    every : int, optional
+        Keep only every k-th step (and the last one); default: 1.
+    out : str, numpy.ndarray or callable, optional
+        Where the kept steps go. None returns arrays in memory. A path creates a
+        .npy file (through np.lib.format.open_memmap) and an array (e.g. an
+        np.memmap) of shape (rows, 1 + y0.size) is filled; both receive rows
+        [t, y...] written sequentially in blocks of block_size rows. A callable
+        is called as out(t_block, y_block) for every block. Memory use is then
+        independent of N.
+    block_size : int, optional
+        Number of rows per block for files, arrays and callbacks (default: 4096).
     
     Returns
     -------
     t : ndarray
         Time points.
     w : ndarray
-        Approximated solution at each time point.
+        Approximated solution at each time point, of shape (rows,) + shape of y0.
+        For a file or array these are views of its columns; for a callback,
+        (t, w) are the final time and state.
     """
     # Compute N and h
     if N is None and h is None:
@@ -39,20 +55,26 @@ def euler_method(f, a, b, y0, N=None, h=None):
     N = int(N)
     h = (b - a) / N
 
-    # Initialize arrays
-    t = np.zeros(N + 1)
-    w = np.zeros(N + 1)
+    # Initialize the output and two flat state rows used alternately
+    y0 = np.asarray(y0)
+    y0 = y0.astype(np.result_type(y0, float))
+    sink = OutputSink(N, every, out, y0.shape, y0.dtype, block_size)
+    w = np.empty((2, y0.size), dtype=y0.dtype)
+    view = _state_view(y0.shape)
 
     # Initial conditions
-    t[0] = a
-    w[0] = y0
+    w[0] = y0.ravel()
+    sink.write(a, w[0])
 
-    # Euler's iterative formula
+    # Euler's iterative formula, written in place into the next row
     for i in range(1, N + 1):
-        w[i] = w[i-1] + h * f(t[i-1], w[i-1])
-        t[i] = a + i*h
+        w_prev, w_next = w[(i-1) % 2], w[i % 2]
+        np.multiply(np.reshape(f(a + (i-1)*h, view(w_prev)), -1), h, out=w_next)
+        w_next += w_prev
+        if sink.wants(i):
+            sink.write(a + i*h, w_next)
 
-    return t, w
+    return sink.result()
 
 # Test the function
 if __name__ == "__main__":
@@ -63,7 +85,8 @@ if __name__ == "__main__":
     print("t:", t)
     print("w:", w)
 
-    # Plot the result
+    # Plot the result (matplotlib is an optional dependency: pip install mth308lib[plot])
+    import matplotlib.pyplot as plt
     plt.plot(t, w, 'o-', label='Euler Approximation')
     plt.xlabel('t')
     plt.ylabel('w(t)')
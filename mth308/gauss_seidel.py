@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
-def gauss_seidel(A, b, x0=None, max_iter=25, tol=1e-10):
+
+
+def gauss_seidel(A, b, x0=None, max_iter=25, tol=1e-10, callback=None, return_result=False):
     """
     Solve the linear system Ax = b using the Gauss-Seidel iterative method.
 
@@ -15,6 +19,12 @@ def gauss_seidel(A, b, x0=None, max_iter=25, tol=1e-10):
         Maximum number of iterations (default: 25).
     tol : float, optional
         Convergence tolerance (default: 1e-10).
+    callback : callable, optional
+        Called as callback(k, x_k, ||x_k - x_{k-1}||_inf) after every iteration,
+        e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult with the last iterate as its solution
+        instead of the tuple below.
 
     Returns
     -------
@@ -35,6 +45,7 @@ def gauss_seidel(A, b, x0=None, max_iter=25, tol=1e-10):
     >>> X, converged = gauss_seidel(A, b, max_iter=10)
     >>> print(X)
     """
+    start = time.perf_counter()
     A = np.array(A, dtype=float)
     b = np.array(b, dtype=float)
     n = A.shape[0]
@@ -63,9 +74,20 @@ def gauss_seidel(A, b, x0=None, max_iter=25, tol=1e-10):
             u = np.dot(A[i, :i], x[:i])
             x[i] = (1 / A[i, i]) * (b[i] - u - z)
         X[:, k+1] = x
-        if np.linalg.norm(x - x_old, ord=np.inf) < tol:
+        err = np.linalg.norm(x - x_old, ord=np.inf)
+        if callback is not None:
+            callback(k + 1, x, err)
+        if err < tol:
+            if return_result:
+                from .result import CONVERGED, SolverResult
+                return SolverResult(x, k + 1, k + 1, time.perf_counter() - start,
+                                    np.max(np.abs(b - A @ x)), CONVERGED)
             return X[:, :k+2], True
 
+    if return_result:
+        from .result import MAX_ITER, SolverResult
+        return SolverResult(x, max_iter, max_iter, time.perf_counter() - start,
+                            np.max(np.abs(b - A @ x)), MAX_ITER)
     return X, False
 
 # Example demonstration
@@ -2,6 +2,11 @@
 
 import numpy as np
 
+def _check_pivot(p):
+    # A zero pivot makes the factorization impossible; an overflowed one makes it useless
+    if p == 0 or not np.isfinite(p):
+        raise ValueError("Factorization is not possible.")
+
 def lu_doolittle(a):
     """
     Perform LU Decomposition of a square matrix using Doolittle's method.
@@ -21,29 +26,26 @@ def lu_doolittle(a):
     Raises
     ------
     ValueError
-        If the matrix is singular or factorization is not possible.
+        If the matrix is singular or factorization is not possible (a zero or
+        non-finite pivot, including the last one).
     """
     n = a.shape[0]
     L = np.eye(n)
     U = np.zeros((n, n))
-    if a[0, 0] == 0:
-        raise ValueError("Factorization is not possible.")
+    _check_pivot(a[0, 0])
     U[0, 0] = a[0, 0]
-    for j in range(1, n):
-        U[0, j] = a[0, j] / L[0, 0]
-        L[j, 0] = a[j, 0] / U[0, 0]
+    U[0, 1:] = a[0, 1:] / L[0, 0]
+    L[1:, 0] = a[1:, 0] / U[0, 0]
     for i in range(1, n-1):
-        s = sum(L[i, k] * U[k, i] for k in range(i))
+        s = L[i, :i] @ U[:i, i]
         U[i, i] = (a[i, i] - s) / L[i, i]
-        if U[i, i] == 0:
-            raise ValueError("Factorization is not possible.")
-        for j in range(i+1, n):
-            r = sum(L[i, k] * U[k, j] for k in range(i))
-            U[i, j] = (a[i, j] - r) / L[i, i]
-            t = sum(L[j, k] * U[k, i] for k in range(i))
-            L[j, i] = (a[j, i] - t) / U[i, i]
-    w = sum(L[n-1, k] * U[k, n-1] for k in range(n-1))
+        _check_pivot(U[i, i])
+        # Row i of U and column i of L, one vectorized pass each
+        U[i, i+1:] = (a[i, i+1:] - L[i, :i] @ U[:i, i+1:]) / L[i, i]
+        L[i+1:, i] = (a[i+1:, i] - L[i+1:, :i] @ U[:i, i]) / U[i, i]
+    w = L[n-1, :n-1] @ U[:n-1, n-1]
     U[n-1, n-1] = (a[n-1, n-1] - w) / L[n-1, n-1]
+    _check_pivot(U[n-1, n-1])
     return L, U
 
 def lu_crout(a):
@@ -65,31 +67,129 @@ def lu_crout(a):
     Raises
     ------
     ValueError
-        If the matrix is singular or factorization is not possible.
+        If the matrix is singular or factorization is not possible (a zero or
+        non-finite pivot, including the last one).
     """
     n = a.shape[0]
     U = np.eye(n)
     L = np.zeros((n, n))
-    if a[0, 0] == 0:
-        raise ValueError("Factorization is not possible.")
+    _check_pivot(a[0, 0])
     L[0, 0] = a[0, 0]
-    for j in range(1, n):
-        L[j, 0] = a[j, 0] / U[0, 0]
-        U[0, j] = a[0, j] / L[0, 0]
+    L[1:, 0] = a[1:, 0] / U[0, 0]
+    U[0, 1:] = a[0, 1:] / L[0, 0]
     for i in range(1, n - 1):
-        s = sum(L[i, k] * U[k, i] for k in range(i))
+        s = L[i, :i] @ U[:i, i]
         L[i, i] = (a[i, i] - s) / U[i, i]
-        if L[i, i] == 0:
-            raise ValueError("Factorization is not possible.")
-        for j in range(i + 1, n):
-            t = sum(L[j, k] * U[k, i] for k in range(i))
-            L[j, i] = (a[j, i] - t) / U[i, i]
-            r = sum(L[i, k] * U[k, j] for k in range(i))
-            U[i, j] = (a[i, j] - r) / L[i, i]
-    w = sum(L[n - 1, k] * U[k, n - 1] for k in range(n - 1))
+        _check_pivot(L[i, i])
+        L[i + 1:, i] = (a[i + 1:, i] - L[i + 1:, :i] @ U[:i, i]) / U[i, i]
+        U[i, i + 1:] = (a[i, i + 1:] - L[i, :i] @ U[:i, i + 1:]) / L[i, i]
+    w = L[n - 1, :n - 1] @ U[:n - 1, n - 1]
     L[n - 1, n - 1] = (a[n - 1, n - 1] - w) / U[n - 1, n - 1]
+    _check_pivot(L[n - 1, n - 1])
     return L, U
 
+def lu_pivot(a):
+    """
+    Perform LU Decomposition of a square matrix with partial pivoting.
+
+    Doolittle's method with row exchanges: in every column the entry of largest
+    magnitude on or below the diagonal becomes the pivot. Unlike lu_doolittle,
+    this succeeds for every nonsingular matrix, including those with a zero or
+    tiny leading pivot.
+
+    Parameters
+    ----------
+    a : numpy.ndarray
+        The square matrix to decompose (shape: n x n).
+
+    Returns
+    -------
+    L : numpy.ndarray
+        Lower triangular matrix with unit diagonal (shape: n x n).
+    U : numpy.ndarray
+        Upper triangular matrix (shape: n x n).
+    perm : numpy.ndarray
+        Row permutation (shape: n) such that a[perm] = L @ U.
+
+    Raises
+    ------
+    ValueError
+        If the matrix is singular (a zero or non-finite pivot).
+
+    Example
+    -------
+    >>> A = np.array([[0, 1], [2, 1]], dtype=float)
+    >>> L, U, perm = lu_pivot(A)
+    >>> lu_solve(L, U, [1, 3], perm)
+    array([1., 1.])
+    """
+    # L (below the diagonal) and U (on and above it) overwrite a copy of a
+    lu = np.array(a, dtype=float)
+    n = lu.shape[0]
+    perm = np.arange(n)
+    for k in range(n):
+        # Column k of L (times the pivot) and row k of U, one vectorized pass each
+        lu[k:, k] -= lu[k:, :k] @ lu[:k, k]
+        p = k + int(np.argmax(np.abs(lu[k:, k])))
+        if p != k:
+            lu[[k, p]] = lu[[p, k]]
+            perm[[k, p]] = perm[[p, k]]
+        _check_pivot(lu[k, k])
+        lu[k+1:, k] /= lu[k, k]
+        lu[k, k+1:] -= lu[k, :k] @ lu[:k, k+1:]
+    return np.tril(lu, -1) + np.eye(n), np.triu(lu), perm
+
+def lu_solve(L, U, b, perm=None):
+    """
+    Solve LUx = b by forward and backward substitution.
+
+    Parameters
+    ----------
+    L : numpy.ndarray
+        Lower triangular factor (shape: n x n), e.g. from lu_doolittle or lu_crout.
+    U : numpy.ndarray
+        Upper triangular factor (shape: n x n).
+    b : array_like
+        Right-hand side of shape (n,) or (n, k) for k right-hand sides.
+    perm : array_like, optional
+        Row permutation from lu_pivot; the system solved is then LUx = b[perm].
+
+    Returns
+    -------
+    x : numpy.ndarray
+        Solution with the same shape as b.
+
+    Raises
+    ------
+    ValueError
+        If b has the wrong length or a diagonal entry of L or U is zero or not finite.
+
+    Example
+    -------
+    >>> A = np.array([[4, 3], [6, 3]], dtype=float)
+    >>> L, U = lu_doolittle(A)
+    >>> lu_solve(L, U, [10, 12])
+    array([1., 2.])
+    """
+    b = np.array(b, dtype=float)
+    n = L.shape[0]
+    if b.shape[0] != n:
+        raise ValueError("b must have length n.")
+    if perm is not None:
+        b = b[perm]
+    d = np.concatenate((np.diag(L), np.diag(U)))
+    if np.any(d == 0) or not np.all(np.isfinite(d)):
+        raise ValueError("The factors are singular.")
+    # Forward substitution: Ly = b
+    y = np.zeros_like(b)
+    for i in range(n):
+        y[i] = (b[i] - L[i, :i] @ y[:i]) / L[i, i]
+    # Backward substitution: Ux = y
+    x = np.zeros_like(b)
+    for i in range(n - 1, -1, -1):
+        x[i] = (y[i] - U[i, i + 1:] @ x[i + 1:]) / U[i, i]
+    return x
+
 if __name__ == "__main__":
     # Example usage for library demonstration
     A = np.array([[4, 3], [6, 3]], dtype=float)
@@ -106,4 +206,14 @@ if __name__ == "__main__":
     Lc, Uc = lu_crout(A)
     print("L =\n", Lc)
     print("U =\n", Uc)
-    print("L @ U =\n", np.dot(Lc, Uc))
\ No newline at end of file
+    print("L @ U =\n", np.dot(Lc, Uc))
+
+    print("\nSolving Ax = [10, 12] with the Doolittle factors:")
+    print("x =", lu_solve(L, U, [10, 12]))
+
+    print("\nPartial pivoting on a matrix with a zero leading pivot:")
+    B = np.array([[0, 1], [2, 1]], dtype=float)
+    Lp, Up, perm = lu_pivot(B)
+    print("perm =", perm)
+    print("L @ U =\n", np.dot(Lp, Up))
+    print("x =", lu_solve(Lp, Up, [1, 3], perm))
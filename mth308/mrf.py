@@ -1,5 +1,8 @@
 import math
-def modified_regula_falsi(f, a, b, tol=1e-7, max_iter=100, verbose=False):
+import time
+
+
+def modified_regula_falsi(f, a, b, tol=1e-7, max_iter=100, verbose=False, callback=None, return_result=False):
     """
     Find a root of the function f in the interval [a, b] using the Modified Regula Falsi (Illinois) method.
 
@@ -10,27 +13,42 @@ def modified_regula_falsi(f, a, b, tol=1e-7, max_iter=100, verbose=False):
         tol (float, optional): The tolerance for convergence. Default is 1e-7.
         max_iter (int, optional): Maximum number of iterations. Default is 100.
         verbose (bool, optional): If True, prints iteration details. Default is False.
+        callback (callable, optional): Called as callback(k, c_k, f(c_k)) after every iteration,
+            e.g. an IterationProfiler.
+        return_result (bool, optional): If True, return a SolverResult instead. Default is False.
 
     Returns:
         float or None: The estimated root, or None if the method fails.
     """
+    start = time.perf_counter()
+
+    def done(x, k, converged, y, reason=None):
+        # Two evaluations at the end points and one per iteration
+        if return_result:
+            from .result import CONVERGED, MAX_ITER, SolverResult
+            status = reason or (CONVERGED if converged else MAX_ITER)
+            return SolverResult(x, k, 2 + k, time.perf_counter() - start, abs(y), status)
+        return x
+
     fa = f(a)
     fb = f(b)
     if fa * fb >= 0:
         if verbose:
             print("The function must have opposite signs at a and b.")
-        return None
+        return done(None, 0, False, fb, "f(a) and f(b) do not have opposite signs")
 
     for i in range(max_iter):
         c = b - fb * (b - a) / (fb - fa)
         fc = f(c)
         if verbose:
             print(f"Iter {i+1}: a={a:.8f}, b={b:.8f}, c={c:.8f}, f(c)={fc:.8f}")
+        if callback is not None:
+            callback(i + 1, c, fc)
 
         if abs(fc) < tol:
             if verbose:
                 print(f"Root found at x = {c:.8f}")
-            return c
+            return done(c, i + 1, True, fc)
 
         # Update endpoints using modified regula falsi (Illinois)
         if fa * fc < 0:
@@ -42,7 +60,7 @@ def modified_regula_falsi(f, a, b, tol=1e-7, max_iter=100, verbose=False):
 
     if verbose:
         print("Maximum iterations reached.")
-    return (a + b) / 2
+    return done((a + b) / 2, max_iter, False, fc if max_iter > 0 else fb)
 
 # Example demonstration
 if __name__ == "__main__":
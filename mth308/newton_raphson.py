@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
-def newton_raphson(f, df, x0, max_iter=100, tol=1e-7, verbose=False):
+
+
+def newton_raphson(f, df, x0, max_iter=100, tol=1e-7, verbose=False, callback=None, return_result=False):
     """
     Find a root of the equation f(x) = 0 using the Newton-Raphson method.
 
@@ -17,6 +21,12 @@ def newton_raphson(f, df, x0, max_iter=100, tol=1e-7, verbose=False):
         Tolerance for convergence (default is 1e-7).
     verbose : bool, optional
         If True, prints iteration details.
+    callback : callable, optional
+        Called as callback(k, x_k, f(x_k)) at every iteration, e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult instead of (root, info). Its n_fevals
+        counts the evaluations of f and df, and its residual is |f(x_k)| at the
+        last iterate at which f was evaluated.
 
     Returns
     -------
@@ -25,23 +35,35 @@ def newton_raphson(f, df, x0, max_iter=100, tol=1e-7, verbose=False):
     info : dict
         Dictionary containing convergence information.
     """
+    start = time.perf_counter()
+
+    def done(x, k, reason, fx):
+        if return_result:
+            from .result import CONVERGED, MAX_ITER, SolverResult
+            status = {'Converged': CONVERGED, 'Max iterations': MAX_ITER}.get(reason, reason.lower())
+            return SolverResult(x, k, 2 * k, time.perf_counter() - start, abs(fx), status)
+        return x, {'converged': reason == 'Converged', 'iterations': k, 'reason': reason}
+
     x = x0
+    fx = np.nan
     for k in range(1, max_iter + 1):
         fx = f(x)
         dfx = df(x)
         if verbose:
             print(f"{k:8d} {x:14.10f} {fx:14.10f}")
+        if callback is not None:
+            callback(k, x, fx)
         if dfx == 0:
             if verbose:
                 print("Derivative is zero. Method fails.")
-            return None, {'converged': False, 'iterations': k, 'reason': 'Zero derivative'}
+            return done(None, k, 'Zero derivative', fx)
         x_new = x - fx / dfx
         if abs(x_new - x) <= tol:
-            return x_new, {'converged': True, 'iterations': k, 'reason': 'Converged'}
+            return done(x_new, k, 'Converged', fx)
         x = x_new
     if verbose:
         print(f"Maximum number of iterations ({max_iter}) reached. Method fails.")
-    return None, {'converged': False, 'iterations': max_iter, 'reason': 'Max iterations'}
+    return done(None, max_iter, 'Max iterations', fx)
 
 # Example demonstration
 if __name__ == "__main__":
@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
-def power_method(A, x0, tol=1e-6, max_iter=1000):
+
+
+def power_method(A, x0, tol=1e-6, max_iter=1000, callback=None, return_result=False):
     """
     Computes the dominant eigenvalue and corresponding eigenvector of a square matrix using the Power Method.
 
@@ -13,6 +17,11 @@ def power_method(A, x0, tol=1e-6, max_iter=1000):
         Tolerance for convergence (default is 1e-6).
     max_iter : int, optional
         Maximum number of iterations (default is 1000).
+    callback : callable, optional
+        Called as callback(k, x_k, mu_k) after every iteration, e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult whose solution is the pair
+        (eigenvalue, eigenvector of shape (n,)) instead of the tuple below.
 
     Returns
     -------
@@ -25,11 +34,13 @@ def power_method(A, x0, tol=1e-6, max_iter=1000):
     eigenvector_iters : np.ndarray
         Array of eigenvector approximations at each iteration (n, num_iters+1).
     """
+    start = time.perf_counter()
     n = A.shape[0]
     x = np.array(x0, dtype=float).reshape((n, 1))
     p = np.argmax(np.abs(x))
     z = x.copy()
     Mu = []
+    converged, reason = False, None
 
     for k in range(max_iter):
         y = A @ x
@@ -37,13 +48,24 @@ def power_method(A, x0, tol=1e-6, max_iter=1000):
         Mu.append(mu)
         p = np.argmax(np.abs(y))
         if y[p, 0] == 0:
+            reason = "A x is zero"
             break
         ERR = np.linalg.norm(x - y / y[p, 0], ord=np.inf)
         x = y / y[p, 0]
         z = np.hstack((z, x))
+        if callback is not None:
+            callback(k + 1, x, mu)
         if ERR < tol:
+            converged = True
             break
 
+    if return_result:
+        from .result import CONVERGED, MAX_ITER, SolverResult
+        status = reason or (CONVERGED if converged else MAX_ITER)
+        # One product with A per iteration
+        residual = np.max(np.abs(A @ x - Mu[-1] * x))
+        return SolverResult((Mu[-1], x.ravel()), len(Mu), len(Mu), time.perf_counter() - start,
+                            residual, status)
     return Mu[-1], x, Mu, z
 
 # Example demonstration
@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
-def regula_falsi(f, a, b, N=100, tol=1e-9, verbose=False):
+
+
+def regula_falsi(f, a, b, N=100, tol=1e-9, verbose=False, callback=None, return_result=False):
     """
     Find a root of the equation f(x) = 0 using the Regula-Falsi (False Position) method.
 
@@ -17,6 +21,10 @@ def regula_falsi(f, a, b, N=100, tol=1e-9, verbose=False):
         Tolerance for stopping criterion (default is 1e-9).
     verbose : bool, optional
         If True, prints iteration details.
+    callback : callable, optional
+        Called as callback(k, x_k, f(x_k)) after every iteration, e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult instead of the tuple below.
 
     Returns
     -------
@@ -32,12 +40,22 @@ def regula_falsi(f, a, b, N=100, tol=1e-9, verbose=False):
     ValueError
         If f(a) and f(b) do not have opposite signs.
     """
+    start = time.perf_counter()
+
+    def done(x, converged, k, y):
+        # Two evaluations at the end points and one per iteration
+        if return_result:
+            from .result import CONVERGED, MAX_ITER, SolverResult
+            return SolverResult(x, k, 2 + k, time.perf_counter() - start, abs(y),
+                                CONVERGED if converged else MAX_ITER)
+        return x, converged, k
+
     y_0 = f(a)
     y_1 = f(b)
     if y_0 == 0:
-        return a, True, 0
+        return done(a, True, 0, y_0)
     if y_1 == 0:
-        return b, True, 0
+        return done(b, True, 0, y_1)
     if y_0 * y_1 > 0:
         raise ValueError("f(a) and f(b) must have opposite signs.")
 
@@ -49,15 +67,17 @@ def regula_falsi(f, a, b, N=100, tol=1e-9, verbose=False):
         y = f(x)
         if verbose:
             print(f"{k:10d}{a:15.9f}{b:15.9f}{x:15.9f}{y:15.9f}")
+        if callback is not None:
+            callback(k, x, y)
         if abs(y) < tol:
-            return x, True, k
+            return done(x, True, k, y)
         if y_0 * y > 0:
             a = x
             y_0 = y
         else:
             b = x
             y_1 = y
-    return x, False, N
+    return done(x, False, N, y)
 
 # Example demonstration
 if __name__ == "__main__":
@@ -0,0 +1,140 @@
+"""
+result.py
+
+A common result type for the iterative solvers and a per-iteration profiler.
+
+The root finders, the iterative linear solvers and the power method keep their
+historical return values. With return_result=True they return a SolverResult
+instead, which has the same fields for every solver. Each of them also accepts
+callback(k, x, value), which is called once per iteration. IterationProfiler
+is such a callback: it records when each iteration finished, so the time spent
+in the loop can be examined without the cost of verbose printing.
+
+The solvers import this module only when return_result=True, so their
+demonstrations still run as plain scripts (python mth308/bisection.py).
+
+Provides:
+    - SolverResult: Solution, iterations, evaluation count, wall time, residual and status.
+    - IterationProfiler: Callback recording per-iteration timestamps and values.
+
+Example:
+    >>> from mth308 import bisection_method, IterationProfiler
+    >>> with IterationProfiler() as prof:
+    ...     res = bisection_method(lambda x: x**2 - 2, 0, 2, callback=prof, return_result=True)
+    >>> print(res.solution, res.n_fevals, res.status, len(prof.intervals))
+"""
+import time
+
+import numpy as np
+
+CONVERGED = 'converged'
+MAX_ITER = 'max_iter'
+
+
+class SolverResult:
+    """
+    Outcome of an iterative solver.
+
+    Attributes
+    ----------
+    solution : float, numpy.ndarray, tuple or None
+        The approximate solution: a root, a solution vector, or the pair
+        (eigenvalue, eigenvector) for the power method. None if the method
+        failed before producing one.
+    iterations : int
+        Number of iterations performed.
+    n_fevals : int
+        Number of evaluations of f (root finders) or of sweeps over the
+        matrix (linear solvers and the power method).
+    wall_time : float
+        Seconds spent in the solver.
+    residual : float
+        |f(x)| at the last evaluated point (root finders), ||b - Ax||_inf
+        (linear solvers) or ||Ax - mu x||_inf (power method).
+    status : str
+        'converged', 'max_iter', or a short description of why the method failed.
+    """
+
+    __slots__ = ('solution', 'iterations', 'n_fevals', 'wall_time', 'residual', 'status')
+
+    def __init__(self, solution, iterations, n_fevals, wall_time, residual, status):
+        self.solution = solution
+        self.iterations = iterations
+        self.n_fevals = n_fevals
+        self.wall_time = wall_time
+        self.residual = residual
+        self.status = status
+
+    @property
+    def converged(self):
+        """Whether the solver met its tolerance."""
+        return self.status == CONVERGED
+
+    def __repr__(self):
+        fields = ', '.join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"SolverResult({fields})"
+
+
+class IterationProfiler:
+    """
+    Per-iteration callback recording a timestamp, the iteration number, the
+    iterate and the monitored value of every iteration.
+
+    Pass an instance as callback= to a solver. The intervals are measured from
+    the creation of the profiler, or from entering it as a context manager, so
+    the first interval includes the solver's setup.
+    """
+
+    __slots__ = ('start', 'stamps', 'iterations', 'values', 'iterates', 'keep_iterates')
+
+    def __init__(self, keep_iterates=False):
+        self.keep_iterates = keep_iterates
+        self.reset()
+
+    def reset(self):
+        """Discard the recorded iterations and restart the clock."""
+        self.stamps = []
+        self.iterations = []
+        self.values = []
+        self.iterates = []
+        self.start = time.perf_counter()
+
+    def __call__(self, k, x, value):
+        self.stamps.append(time.perf_counter())
+        self.iterations.append(k)
+        self.values.append(value)
+        if self.keep_iterates:
+            self.iterates.append(np.copy(x))
+
+    def __enter__(self):
+        self.reset()
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    @property
+    def intervals(self):
+        """Seconds taken by each iteration, as a numpy array."""
+        return np.diff(np.concatenate(([self.start], self.stamps)))
+
+    @property
+    def total(self):
+        """Seconds from the start until the last recorded iteration."""
+        return self.stamps[-1] - self.start if self.stamps else 0.0
+
+
+# Example demonstration
+if __name__ == "__main__":
+    from .bisection import bisection_method
+    from .newton_raphson import newton_raphson
+
+    f = lambda x: x**3 - 2 * x - 5
+    for name, solve in (('bisection', lambda cb: bisection_method(f, 2, 3, eps=1e-12, callback=cb,
+                                                                    return_result=True)),
+                        ('newton', lambda cb: newton_raphson(f, lambda x: 3 * x**2 - 2, 2.0, tol=1e-12,
+                                                             callback=cb, return_result=True))):
+        with IterationProfiler() as prof:
+            res = solve(prof)
+        print(f"{name:10s} {res}")
+        print(f"{'':10s} mean iteration time {1e6 * prof.intervals.mean():.2f} us over {len(prof.intervals)} iterations")
@@ -0,0 +1,255 @@
+"""
+rk45.py
+
+Adaptive Runge-Kutta integration with the Dormand-Prince 5(4) pair.
+
+Every step computes a 5th-order solution and an embedded 4th-order one; their
+difference estimates the local error, and a PI controller adapts the step size
+so that the error stays within rtol/atol. The last stage of an accepted step is
+the derivative at the new point (FSAL, "first same as last"), so a step costs
+six evaluations of f. A quartic continuous extension of each step gives the
+solution at arbitrary output times without shortening the steps.
+
+Provides:
+    - rk45: Solve dy/dt = f(t, y) with adaptive step size and dense output.
+
+Example:
+    >>> import numpy as np
+    >>> from rk45 import rk45
+    >>> t, y, info = rk45(lambda t, y: -2 * y, 0, 1, 2, t_eval=np.linspace(0, 2, 5))
+    >>> print(y, info['nfev'])
+"""
+import numpy as np
+
+from .rk4 import _state_view
+
+# Dormand-Prince tableau
+_C = np.array([0, 1/5, 3/10, 4/5, 8/9, 1, 1])
+_A = [
+    np.array([]),
+    np.array([1/5]),
+    np.array([3/40, 9/40]),
+    np.array([44/45, -56/15, 32/9]),
+    np.array([19372/6561, -25360/2187, 64448/6561, -212/729]),
+    np.array([9017/3168, -355/33, 46732/5247, 49/176, -5103/18656]),
+    np.array([35/384, 0, 500/1113, 125/192, -2187/6784, 11/84]),
+]
+# Difference between the 5th- and 4th-order weights
+_E = np.array([71/57600, 0, -71/16695, 71/1920, -17253/339200, 22/525, -1/40])
+# Coefficients of the continuous extension: y(t + s h) = y + h K^T P [s, s^2, s^3, s^4]
+_P = np.array([
+    [1, -8048581381/2820520608, 8663915743/2820520608, -12715105075/11282082432],
+    [0, 0, 0, 0],
+    [0, 131558114200/32700410799, -68118460800/10900136933, 87487479700/32700410799],
+    [0, -1754552775/470086768, 14199869525/1410260304, -10690763975/1880347072],
+    [0, 127303824393/49829197408, -318862633887/49829197408, 701980252875/199316789632],
+    [0, -282668133/205662961, 2019193451/616988883, -1453857185/822651844],
+    [0, 40617522/29380423, -110615467/29380423, 69997945/29380423],
+])
+
+# Step size controller
+_SAFETY = 0.9
+_MIN_FACTOR = 0.2
+_MAX_FACTOR = 10.0
+_ALPHA = 0.7 / 5
+_BETA = 0.4 / 5
+
+
+def _rms(x):
+    return np.sqrt(np.mean(x * x))
+
+
+def _initial_step(fun, t0, y0, f0, rtol, atol):
+    """Starting step size from the size of y0, f0 and a second derivative estimate (one evaluation)."""
+    scale = atol + rtol * np.abs(y0)
+    d0, d1 = _rms(y0 / scale), _rms(f0 / scale)
+    h0 = 1e-6 if d0 < 1e-5 or d1 < 1e-5 else 0.01 * d0 / d1
+    f1 = fun(t0 + h0, y0 + h0 * f0)
+    d2 = _rms((f1 - f0) / scale) / h0
+    if max(d1, d2) <= 1e-15:
+        h1 = max(1e-6, h0 * 1e-3)
+    else:
+        h1 = (0.01 / max(d1, d2)) ** (1 / 5)
+    return min(100 * h0, h1)
+
+
+def rk45(f, t0, y0, t_end, rtol=1e-6, atol=1e-9, h0=None, t_eval=None, max_steps=100000):
+    """
+    Solve the ODE dy/dt = f(t, y) from t0 to t_end with the adaptive Dormand-Prince 5(4) method.
+
+    A step is accepted when the RMS norm of the error estimate, scaled by
+    atol + rtol * |y|, is at most 1. The next step size is
+    h * 0.9 * err^(-0.7/5) * err_prev^(0.4/5) (PI control), limited to a factor
+    between 0.2 and 10; after a rejection the step is only reduced.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(t, y) returning dy/dt with the shape of y.
+    t0 : float
+        Initial time.
+    y0 : float or array_like
+        Initial value y(t0) (a scalar or an array for a system of ODEs).
+    t_end : float
+        Final time (t_end > t0).
+    rtol : float, optional
+        Relative tolerance (default: 1e-6).
+    atol : float or array_like, optional
+        Absolute tolerance (default: 1e-9).
+    h0 : float, optional
+        Initial step size. If None, it is estimated from f(t0, y0).
+    t_eval : array_like, optional
+        Increasing output times in [t0, t_end]. The solution there is computed
+        from the continuous extension of the step that covers each time, so the
+        step sizes are not affected. If None, the solution is returned at every
+        accepted step.
+    max_steps : int, optional
+        Maximum number of steps, accepted or rejected (default: 100000).
+
+    Returns
+    -------
+    t : numpy.ndarray
+        Output times. With t_eval, the entries of t_eval that were reached
+        (all of them unless the integration failed).
+    y : numpy.ndarray
+        Solution at the output times, of shape (len(t),) + shape of y0.
+    info : dict
+        'success' (t_end reached), 'reason', 'n_accepted', 'n_rejected' and
+        'nfev' (number of evaluations of f).
+
+    Raises
+    ------
+    ValueError
+        If t_end <= t0, the tolerances are not positive or t_eval is not
+        increasing within [t0, t_end].
+
+    Example
+    -------
+    >>> t, y, info = rk45(lambda t, y: -y, 0, 1.0, 1.0, t_eval=[0.5, 1.0])
+    >>> np.allclose(y, np.exp(-t))
+    True
+    """
+    if not t_end > t0:
+        raise ValueError("t_end must be greater than t0.")
+    if rtol <= 0 or np.any(np.asarray(atol) <= 0):
+        raise ValueError("rtol and atol must be positive.")
+    y0 = np.asarray(y0)
+    y0 = y0.astype(np.result_type(y0, float))
+    shape = y0.shape
+    view = _state_view(shape)
+    atol = np.broadcast_to(np.asarray(atol, dtype=float), shape).ravel()
+
+    nfev = [0]
+
+    def fun(t, y):
+        nfev[0] += 1
+        return np.reshape(f(t, view(y)), -1)
+
+    if t_eval is not None:
+        t_eval = np.asarray(t_eval, dtype=float).ravel()
+        if np.any(np.diff(t_eval) < 0) or (len(t_eval) and (t_eval[0] < t0 or t_eval[-1] > t_end)):
+            raise ValueError("t_eval must be increasing and within [t0, t_end].")
+        y_eval = np.empty((len(t_eval), y0.size), dtype=y0.dtype)
+        n_done = np.searchsorted(t_eval, t0, side='right')
+        y_eval[:n_done] = y0.ravel()
+    else:
+        t_out, y_out = [t0], [y0.ravel().copy()]
+
+    t = t0
+    y = y0.ravel().copy()
+    K = np.empty((7, y.size), dtype=y.dtype)
+    K[0] = fun(t, y)
+    if h0 is None:
+        h = _initial_step(fun, t, y, K[0], rtol, atol)
+    else:
+        h = float(h0)
+    y_stage = np.empty_like(y)
+
+    n_accepted = n_rejected = 0
+    err_prev = 1e-4
+    rejected = False
+    success, reason = False, "Maximum number of steps reached"
+
+    for _ in range(max_steps):
+        if h < 10 * np.finfo(float).eps * max(abs(t), 1.0):
+            reason = "Step size too small"
+            break
+        last = h >= t_end - t
+        if last:
+            h = t_end - t
+
+        # Stages 2..7; the 7th is f at the 5th-order solution (FSAL)
+        for i in range(1, 7):
+            np.dot(_A[i], K[:i], out=y_stage)
+            y_stage *= h
+            y_stage += y
+            K[i] = fun(t + _C[i] * h, y_stage)
+        y_new = y_stage.copy()
+
+        scale = atol + rtol * np.maximum(np.abs(y), np.abs(y_new))
+        err = _rms(h * (_E @ K) / scale)
+
+        if err <= 1:
+            t_new = t_end if last else t + h
+            if t_eval is not None:
+                stop = np.searchsorted(t_eval, t_new, side='right')
+                if stop > n_done:
+                    # Dense output on [t, t_new] from the quartic continuous extension
+                    s = (t_eval[n_done:stop] - t) / h
+                    Q = K.T @ _P
+                    y_eval[n_done:stop] = y + h * (Q @ np.vstack((s, s**2, s**3, s**4))).T
+                    n_done = stop
+            else:
+                t_out.append(t_new)
+                y_out.append(y_new)
+
+            if err == 0:
+                factor = _MAX_FACTOR
+            else:
+                factor = _SAFETY * err ** -_ALPHA * err_prev ** _BETA
+            factor = min(_MAX_FACTOR, max(_MIN_FACTOR, factor))
+            if rejected:
+                factor = min(1.0, factor)
+            t, y = t_new, y_new
+            K[0] = K[6]
+            err_prev = max(err, 1e-4)
+            rejected = False
+            n_accepted += 1
+            h *= factor
+            if last:
+                success, reason = True, "Reached t_end"
+                break
+        else:
+            h *= max(_MIN_FACTOR, _SAFETY * err ** (-1 / 5))
+            rejected = True
+            n_rejected += 1
+
+    info = {'success': success, 'reason': reason, 'n_accepted': n_accepted,
+            'n_rejected': n_rejected, 'nfev': nfev[0]}
+    if t_eval is not None:
+        return t_eval[:n_done], y_eval[:n_done].reshape((n_done,) + shape), info
+    return np.array(t_out), np.array(y_out).reshape((len(t_out),) + shape), info
+
+
+# Example demonstration
+if __name__ == "__main__":
+    from .rk4 import rk4
+
+    # A sharp transient followed by smooth decay: y' = -50 (y - cos t)
+    f = lambda t, y: -50 * (y - np.cos(t))
+    exact = lambda t: (2500 * np.cos(t) + 50 * np.sin(t)) / 2501 + (1 - 2500 / 2501) * np.exp(-50 * t)
+
+    t_eval = np.linspace(0, 10, 11)
+    t, y, info = rk45(f, 0, 1.0, 10, rtol=1e-8, atol=1e-10, t_eval=t_eval)
+    print(f"rk45: max error = {np.max(np.abs(y - exact(t))):.1e}, {info['n_accepted']} accepted, "
+          f"{info['n_rejected']} rejected steps, {info['nfev']} evaluations")
+
+    x, y4 = rk4(f, 0, 1.0, 1e-3, 10000)
+    print(f"rk4 with h = 1e-3: max error = {np.max(np.abs(y4 - exact(x))):.1e}, {4 * 10000} evaluations")
+
+    # Van der Pol oscillator (mu = 5) as a system
+    mu = 5.0
+    vdp = lambda t, y: np.array([y[1], mu * (1 - y[0]**2) * y[1] - y[0]])
+    t, y, info = rk45(vdp, 0, [2.0, 0.0], 20)
+    print(f"\nVan der Pol, mu = {mu}: {info['n_accepted']} accepted, {info['n_rejected']} rejected, "
+          f"{info['nfev']} evaluations, smallest step {np.min(np.diff(t)):.1e}, largest {np.max(np.diff(t)):.1e}")
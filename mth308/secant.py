@@ -1,6 +1,10 @@
 
+import time
+
 import numpy as np
-def secant_method(f, x0, x1, tol=1e-8, max_iter=100):
+
+
+def secant_method(f, x0, x1, tol=1e-8, max_iter=100, callback=None, return_result=False):
     """
     Find a root of the equation f(x) = 0 using the Secant method.
 
@@ -16,6 +20,11 @@ def secant_method(f, x0, x1, tol=1e-8, max_iter=100):
         The tolerance for stopping criterion (default is 1e-8).
     max_iter : int, optional
         The maximum number of iterations (default is 100).
+    callback : callable, optional
+        Called as callback(k, x_k, f(x_k)) for every new iterate, e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult instead of (root, history, message);
+        its iterations count the iterates after x0 and x1.
 
     Returns
     -------
@@ -26,31 +35,45 @@ def secant_method(f, x0, x1, tol=1e-8, max_iter=100):
     message : str
         Description of the result.
     """
+    start = time.perf_counter()
+
+    def done(x, message, converged, reason=None):
+        # One evaluation per history entry
+        if return_result:
+            from .result import CONVERGED, MAX_ITER, SolverResult
+            status = reason or (CONVERGED if converged else MAX_ITER)
+            return SolverResult(x, len(history) - 2, len(history), time.perf_counter() - start,
+                                abs(history[-1][2]), status)
+        return x, history, message
+
     y0 = f(x0)
     y1 = f(x1)
     history = [(1, x0, y0), (2, x1, y1)]
 
     if y0 == 0:
-        return x0, history, f"A root of the given equation is {x0}."
+        return done(x0, f"A root of the given equation is {x0}.", True)
     if y1 == 0:
-        return x1, history, f"A root of the given equation is {x1}."
+        return done(x1, f"A root of the given equation is {x1}.", True)
     if y0 == y1:
-        return None, history, "Secant method cannot locate any root for the given equation (f(x0) == f(x1))."
+        return done(None, "Secant method cannot locate any root for the given equation (f(x0) == f(x1)).",
+                    False, "f(x0) == f(x1)")
 
     for k in range(3, max_iter + 3):
         if y1 - y0 == 0:
-            return None, history, "Division by zero encountered in Secant method."
+            return done(None, "Division by zero encountered in Secant method.", False, "division by zero")
         x = x1 - (y1 * (x1 - x0)) / (y1 - y0)
         y = f(x)
         history.append((k, x, y))
+        if callback is not None:
+            callback(k - 2, x, y)
         if y == 0:
-            return x, history, f"A root of the given equation is {x}."
+            return done(x, f"A root of the given equation is {x}.", True)
         if abs(x - x1) <= tol:
-            return x, history, f"An approximate root (with tolerance {tol}) of the given equation is {x}."
+            return done(x, f"An approximate root (with tolerance {tol}) of the given equation is {x}.", True)
         x0, y0 = x1, y1
         x1, y1 = x, y
 
-    return None, history, f"Maximum number of iterations ({max_iter}) reached. The method failed."
+    return done(None, f"Maximum number of iterations ({max_iter}) reached. The method failed.", False)
 
 # Example demonstration
 if __name__ == "__main__":
@@ -5,14 +5,19 @@ A reusable library for numerical integration using Simpson's 1/3 Rule.
 
 Provides:
     - simpsons_one_third: Compute the definite integral of a function using Simpson's 1/3 Rule.
+    - adaptive_simpson: Adaptive Simpson quadrature with local error control.
 
 Example:
     >>> from simpsons import simpsons_one_third
     >>> result = simpsons_one_third(lambda x: x**2, 0, 2, N=100)
     >>> print(result)
 """
+from collections import deque
 
-def simpsons_one_third(f, a, b, N=None, h=None):
+from ._quadrature import CHUNK_SIZE, batched_grid_dot, grid_dot, parallel_grid_sum, simpson_weights
+
+def simpsons_one_third(f, a, b, N=None, h=None, vectorized=False, chunk_size=CHUNK_SIZE, params=None,
+                       n_workers=None):
     """
     Approximate the definite integral of f(x) from a to b using Simpson's 1/3 Rule.
 
@@ -30,11 +35,30 @@ def simpsons_one_third(f, a, b, N=None, h=None):
         Even number of sub-intervals. N must be even.
     h : float, optional
         Step size. If specified, N is computed as N = (b - a) / h.
+    vectorized : bool, optional
+        If True, f is called on NumPy arrays of up to chunk_size nodes and the
+        weights 1, 4, 2, ..., 4, 1 are applied with one dot product per chunk. If f
+        does not accept arrays, the scalar loop is used instead (default: False).
+    chunk_size : int, optional
+        Number of nodes per call of f in vectorized mode (default: 65536). With
+        params, the number of values per (parameters x nodes) block.
+    params : array_like or tuple of array_like, optional
+        Batched mode: integrate f(x; theta) for every parameter value at once.
+        f is called as f(x, *theta) with x of shape (1, M) and each parameter of
+        shape (P, 1), and returns a (P, M) block; parameters are chunked to bound
+        memory. Pass a tuple of equal-length arrays for several parameters.
+    n_workers : int, optional
+        If greater than 1, the nodes are split into panels of at most chunk_size
+        (at least four per worker), summed on a process pool of n_workers and
+        combined with Neumaier summation. Each panel calls f on an array if
+        vectorized, else node by node. f must be picklable (defined at module
+        level). Ignored when params is given (default: None, serial).
 
     Returns
     -------
-    float
-        Approximation of the definite integral of f from a to b.
+    float or numpy.ndarray
+        Approximation of the definite integral of f from a to b, or an array with
+        one integral per parameter value if params is given.
 
     Raises
     ------
@@ -45,6 +69,8 @@ def simpsons_one_third(f, a, b, N=None, h=None):
     -------
     >>> simpsons_one_third(lambda x: x**2, 0, 2, N=100)
     2.6666666666666665
+    >>> simpsons_one_third(lambda x, k: x**k, 0, 1, N=100, params=[1, 2, 3])
+    array([0.5       , 0.33333333, 0.25      ])
     """
     # Determine N and h
     if N is None and h is None:
@@ -60,6 +86,17 @@ def simpsons_one_third(f, a, b, N=None, h=None):
     # Step-1: Compute h
     h = (b - a) / N
 
+    if params is not None:
+        return h/3 * batched_grid_dot(f, a, h, simpson_weights, N, params, chunk_size)
+
+    if n_workers is not None and n_workers > 1:
+        return h/3 * parallel_grid_sum(f, a, h, simpson_weights, N, n_workers, chunk_size, vectorized)
+
+    if vectorized:
+        T_h = grid_dot(f, a, h, simpson_weights, 0, N + 1, N, chunk_size)
+        if T_h is not None:
+            return T_h * h/3
+
     # Step-2: Initialize T_h
     T_h = f(a) + f(b)
 
@@ -76,6 +113,87 @@ def simpsons_one_third(f, a, b, N=None, h=None):
 
     return T_h
 
+def adaptive_simpson(f, a, b, tol=1e-8, max_evals=100000, min_depth=3, max_depth=50):
+    """
+    Approximate the definite integral of f(x) from a to b using adaptive Simpson quadrature.
+
+    Each interval [l, r] with midpoint m carries f(l), f(m), f(r) and its Simpson
+    estimate S. Refining it costs only the two new quarter points: the two halves
+    give S_left + S_right, and |S_left + S_right - S| / 15 estimates the error. An
+    interval is accepted when this is below its share of tol; otherwise its halves
+    are put back on the work queue, each with half the tolerance. Accepted intervals
+    contribute the Richardson-corrected value S_left + S_right + (S_left + S_right - S) / 15.
+
+    Parameters
+    ----------
+    f : callable
+        The function f(x) to integrate.
+    a : float
+        The lower limit of integration.
+    b : float
+        The upper limit of integration.
+    tol : float, optional
+        Absolute error tolerance (default: 1e-8).
+    max_evals : int, optional
+        Maximum number of function evaluations (default: 100000).
+    min_depth : int, optional
+        Every interval is bisected at least this many times before it can be
+        accepted, so narrow features are not missed by the first few samples
+        (default: 3).
+    max_depth : int, optional
+        Maximum number of bisections of any interval (default: 50).
+
+    Returns
+    -------
+    integral : float
+        Approximation of the definite integral of f from a to b.
+    info : dict
+        Dictionary with keys 'converged' (every interval met its tolerance),
+        'error' (sum of the local error estimates), 'n_evals' (number of calls of f)
+        and 'intervals' (number of accepted intervals).
+
+    Example
+    -------
+    >>> integral, info = adaptive_simpson(lambda x: 1 / (1e-6 + x**2), -1, 1, tol=1e-6)
+    >>> print(integral, info['n_evals'], info['error'])
+    """
+    m = (a + b) / 2
+    fa, fm, fb = f(a), f(m), f(b)
+    n_evals = 3
+    whole = (b - a) / 6 * (fa + 4 * fm + fb)
+
+    integral = 0.0
+    error = 0.0
+    intervals = 0
+    converged = True
+    queue = deque([(a, b, fa, fm, fb, whole, tol, 0)])
+    while queue:
+        l, r, fl, fm, fr, whole, eps, depth = queue.pop()
+        if n_evals + 2 > max_evals:
+            # Out of budget: accept the current estimate without refining
+            integral += whole
+            intervals += 1
+            converged = False
+            continue
+        m = (l + r) / 2
+        lm, rm = (l + m) / 2, (m + r) / 2
+        flm, frm = f(lm), f(rm)
+        n_evals += 2
+        left = (m - l) / 6 * (fl + 4 * flm + fm)
+        right = (r - m) / 6 * (fm + 4 * frm + fr)
+        delta = left + right - whole
+        if (abs(delta) <= 15 * eps and depth >= min_depth) or depth >= max_depth:
+            integral += left + right + delta / 15
+            error += abs(delta) / 15
+            intervals += 1
+            if abs(delta) > 15 * eps:
+                converged = False
+        else:
+            queue.append((m, r, fm, frm, fr, right, eps / 2, depth + 1))
+            queue.append((l, m, fl, flm, fm, left, eps / 2, depth + 1))
+
+    return integral, {'converged': converged, 'error': error, 'n_evals': n_evals, 'intervals': intervals}
+
 # Example demonstration
 if __name__ == "__main__":
     import math
@@ -93,3 +211,37 @@ if __name__ == "__main__":
     print(f"Simpson's Rule Approximation: {approx}")
     print(f"Exact Value: {exact}")
     print(f"Error: {abs(approx - exact)}")
+
+    # Vectorized evaluation: f is called on arrays of nodes
+    import numpy as np
+    approx = simpsons_one_third(np.sin, 0, math.pi, N=10**7, vectorized=True)
+    print(f"\nIntegrating sin(x) from 0 to pi with N = 10^7 (vectorized): {approx}")
+    print(f"Error: {abs(approx - 2.0)}")
+
+    # Adaptive refinement concentrates the evaluations around the peak at x = 0
+    peak = lambda x: 1 / (1e-6 + x**2)
+    exact = 2 * 1000 * math.atan(1000)
+    approx, info = adaptive_simpson(peak, -1, 1, tol=1e-6)
+    print(f"\nAdaptive Simpson on 1/(1e-6 + x^2) over [-1, 1]: error = {abs(approx - exact):.2e} "
+          f"with {info['n_evals']} evaluations (estimate {info['error']:.2e})")
+    approx = simpsons_one_third(peak, -1, 1, N=info['n_evals'] - info['n_evals'] % 2)
+    print(f"Uniform Simpson with the same number of evaluations: error = {abs(approx - exact):.2e}")
+
+    # Batched mode: one integral per parameter value, all in one vectorized reduction
+    import time
+    k = np.linspace(1, 10, 5000)
+    start = time.perf_counter()
+    batched = simpsons_one_third(lambda x, k: np.exp(-k * x), 0, 1, N=1000, params=k)
+    print(f"\nIntegrating exp(-k x) over [0, 1] for {len(k)} values of k (batched): "
+          f"{time.perf_counter() - start:.3f} s, max error = {np.max(np.abs(batched - (1 - np.exp(-k)) / k)):.2e}")
+
+    # Parallel mode: an expensive scalar integrand evaluated on a process pool
+    import os
+
+    def expensive(x):
+        return sum(math.sin(x + k * 1e-4) for k in range(500))
+
+    for workers in (None, os.cpu_count()):
+        start = time.perf_counter()
+        approx = simpsons_one_third(expensive, 0, 1, N=20000, n_workers=workers)
+        print(f"Expensive integrand, n_workers = {workers}: {approx!r} ({time.perf_counter() - start:.3f} s)")
@@ -1,5 +1,9 @@
+import time
+
 import numpy as np
-def sor_solver(A, b, x0, w, max_iter):
+
+
+def sor_solver(A, b, x0, w, max_iter, callback=None, return_result=False):
     """
     Solve the linear system Ax = b using the Successive Over-Relaxation (SOR) method.
 
@@ -15,6 +19,13 @@ def sor_solver(A, b, x0, w, max_iter):
         SOR relaxation parameter (0 < w < 2).
     max_iter : int
         Maximum number of iterations.
+    callback : callable, optional
+        Called as callback(k, x_k, ||x_k - x_{k-1}||_inf) after every iteration,
+        e.g. an IterationProfiler.
+    return_result : bool, optional
+        If True, return a SolverResult with the last iterate as its solution
+        instead of the array of iterates. All max_iter iterations are run, so
+        its status is 'max_iter'.
 
     Returns
     -------
@@ -40,6 +51,7 @@ def sor_solver(A, b, x0, w, max_iter):
     >>> X = sor_solver(A, b, x0, w, max_iter)
     >>> print(X)
     """
+    start = time.perf_counter()
     n = len(b)
     y = np.zeros(n)
     X = np.zeros((n, max_iter+1))
@@ -57,9 +69,15 @@ def sor_solver(A, b, x0, w, max_iter):
             u = sum(A[i, j]*y[j] for j in range(i))
             z = sum(A[i, j]*x[j] for j in range(i+1, n))
             y[i] = (1-w)*x[i] + (w/A[i,i])*(b[i] - u - z)
+        if callback is not None:
+            callback(k, y, np.max(np.abs(y - x)))
         x = y.copy()
         X[:, k] = x
 
+    if return_result:
+        from .result import MAX_ITER, SolverResult
+        return SolverResult(x, max_iter, max_iter, time.perf_counter() - start,
+                            np.max(np.abs(b - A @ x)), MAX_ITER)
     return X
 
 if __name__ == "__main__":
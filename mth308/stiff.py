@@ -0,0 +1,450 @@
+"""
+stiff.py
+
+Implicit and linearly implicit fixed-step integrators for stiff ODEs.
+
+Each step of the implicit methods solves z = psi + h gamma f(t, z) for the new
+state z with a simplified Newton iteration on the matrix M = I - h gamma J, where
+J approximates the Jacobian of f. M is factorized with lu_pivot and the
+factors are reused across steps for as long as Newton keeps converging quickly.
+Only when it slows down is J re-evaluated and M refactorized, so a long
+integration typically needs a handful of factorizations instead of one per step.
+
+The Rosenbrock method needs no Newton iteration: each step solves two linear
+systems with the same M. It is second order for any approximation J, so J and
+the factors of M can be kept for several steps as well.
+
+If M is singular even with a freshly evaluated Jacobian, the integration stops
+and the returned info reports the failure.
+
+Provides:
+    - backward_euler: First-order backward Euler method.
+    - bdf2: Second-order backward differentiation formula.
+    - rosenbrock: Second-order L-stable Rosenbrock method (ROS2).
+
+Example:
+    >>> import numpy as np
+    >>> from stiff import bdf2
+    >>> t, y, info = bdf2(lambda t, y: -1000 * (y - np.cos(t)), 0, 0.0, 0.01, 100)
+    >>> print(y[-1], info['n_lu'])
+"""
+import numpy as np
+
+from ._ode_output import BLOCK_SIZE, OutputSink
+from .lu import lu_pivot, lu_solve
+from .rk4 import _state_view
+
+
+def _jacobian_fd(fun, t, y, fy):
+    """Forward-difference approximation of the Jacobian of fun at (t, y), one column per evaluation."""
+    m = len(y)
+    J = np.empty((m, m))
+    eps = np.sqrt(np.finfo(float).eps)
+    z = y.copy()
+    for j in range(m):
+        dj = eps * max(1.0, abs(y[j]))
+        z[j] = y[j] + dj
+        J[:, j] = (fun(t, z) - fy) / dj
+        z[j] = y[j]
+    return J
+
+
+class _SingularMatrix(ValueError):
+    """The iteration matrix I - h gamma J could not be factorized."""
+
+
+class _NewtonSolver:
+    """Simplified Newton iteration with a lazily refreshed Jacobian and LU factorization."""
+
+    # Contraction rate above which the iteration matrix is considered stale
+    slow_rate = 0.5
+
+    def __init__(self, fun, jac, tol, max_iter):
+        self.fun = fun
+        self.jac = jac
+        self.tol = tol
+        self.max_iter = max_iter
+        self.J = None
+        self.LU = None
+        self.hg = None
+        self.n_jev = self.n_lu = self.n_iter = 0
+
+    def _refresh_jacobian(self, t, y):
+        if self.jac is None:
+            self.J = _jacobian_fd(self.fun, t, y, self.fun(t, y))
+        else:
+            self.J = np.asarray(self.jac(t, y), dtype=float).reshape(len(y), len(y))
+        self.n_jev += 1
+        self.LU = None
+
+    def _factorize(self, hg):
+        M = np.eye(len(self.J)) - hg * self.J
+        self.n_lu += 1
+        try:
+            self.LU = lu_pivot(M)
+        except ValueError as e:
+            self.LU = None
+            raise _SingularMatrix(f"I - h*gamma*J is singular ({e})") from e
+        self.hg = hg
+
+    def factors(self, t, y, hg, refresh=False):
+        """
+        Make the LU factors of I - hg J current and return whether J was
+        re-evaluated (at (t, y)), which happens if refresh is True or there is no
+        J yet. A singular M built from a stale J is retried with a fresh one; if
+        that is singular too, _SingularMatrix is raised.
+        """
+        fresh = refresh or self.J is None
+        if fresh:
+            self._refresh_jacobian(t, y)
+        if self.LU is None or self.hg != hg:
+            try:
+                self._factorize(hg)
+            except _SingularMatrix:
+                if fresh:
+                    raise
+                self._refresh_jacobian(t, y)
+                self._factorize(hg)
+                fresh = True
+        return fresh
+
+    def _iterate(self, t, psi, hg, z, full=False):
+        """
+        Run the iteration from z; return (z, converged, slow).
+
+        With full=True the Jacobian and factorization are updated at every
+        iterate (full Newton), and slow contraction does not stop the iteration.
+        """
+        norm_prev = None
+        for _ in range(self.max_iter):
+            self.n_iter += 1
+            if full:
+                self._refresh_jacobian(t, z)
+                self._factorize(hg)
+            L, U, perm = self.LU
+            dz = lu_solve(L, U, psi + hg * self.fun(t, z) - z, perm)
+            z = z + dz
+            norm = np.max(np.abs(dz))
+            if not np.isfinite(norm):
+                return z, False, True
+            if norm <= self.tol * (1 + np.max(np.abs(z))):
+                return z, True, norm_prev is not None and norm > self.slow_rate * norm_prev
+            if not full and norm_prev is not None and norm > self.slow_rate * norm_prev:
+                return z, False, True
+            norm_prev = norm
+        return z, False, True
+
+    def solve(self, t, psi, hg, z0, t_prev, y_prev):
+        """
+        Solve z = psi + hg * f(t, z) starting from z0.
+
+        The stored factorization is reused if it belongs to the same hg. If the
+        iteration diverges or converges slowly, the Jacobian is re-evaluated at
+        (t_prev, y_prev), M is refactorized and the iteration is restarted; a slow
+        but successful iteration triggers the refresh for the next step instead.
+        If even a fresh Jacobian does not help, full Newton is used as a last
+        resort. Returns (z, converged); raises _SingularMatrix if M cannot be
+        factorized even with a fresh Jacobian.
+        """
+        fresh = self.factors(t_prev, y_prev, hg)
+        z, converged, slow = self._iterate(t, psi, hg, z0)
+        if converged:
+            if slow:
+                self.J = None
+            return z, True
+        if not fresh:
+            self.factors(t_prev, y_prev, hg, refresh=True)
+            z, converged, _ = self._iterate(t, psi, hg, z0)
+            if converged:
+                return z, True
+        z, converged, _ = self._iterate(t, psi, hg, z0, full=True)
+        return z, converged
+
+
+def _flat_problem(f, y0, jac):
+    """Return (y0, fun, jac, nfev) for the flattened state; nfev[0] counts the calls of fun."""
+    y0 = np.asarray(y0)
+    y0 = y0.astype(np.result_type(y0, float))
+    view = _state_view(y0.shape)
+    nfev = [0]
+
+    def fun(t, y):
+        nfev[0] += 1
+        return np.reshape(f(t, view(y)), -1)
+
+    jac_flat = None if jac is None else (lambda t, y: jac(t, view(y)))
+    return y0, fun, jac_flat, nfev
+
+
+def _info(success, reason, nfev, solver):
+    return {'success': success, 'reason': reason, 'nfev': nfev[0], 'n_jev': solver.n_jev,
+            'n_lu': solver.n_lu, 'n_newton': solver.n_iter}
+
+
+def _implicit_solve(f, x0, y0, h, n, method, jac, tol, max_newton, every, out, block_size):
+    y0, fun, jac_flat, nfev = _flat_problem(f, y0, jac)
+    n = int(n)
+    newton = _NewtonSolver(fun, jac_flat, tol, max_newton)
+    sink = OutputSink(n, every, out, y0.shape, y0.dtype, block_size)
+
+    y_prev = None
+    y = y0.ravel().copy()
+    sink.write(x0, y)
+    success, reason = True, "Completed all steps"
+    for i in range(n):
+        t, t_new = x0 + i * h, x0 + (i + 1) * h
+        if method == 'bdf2' and y_prev is not None:
+            # y_{n+1} = (4 y_n - y_{n-1}) / 3 + 2/3 h f(t_{n+1}, y_{n+1})
+            psi, hg, z0 = (4 * y - y_prev) / 3, 2 * h / 3, 2 * y - y_prev
+        else:
+            # Backward Euler (also the starting step of BDF2)
+            psi, hg, z0 = y, h, y
+        try:
+            y_new, converged = newton.solve(t_new, psi, hg, z0, t, y)
+        except _SingularMatrix as e:
+            success, reason = False, f"{e} at step {i + 1} (t = {t_new})"
+            break
+        if not converged:
+            success, reason = False, f"Newton iteration failed at step {i + 1} (t = {t_new})"
+            break
+        y_prev, y = y, y_new
+        if sink.wants(i + 1):
+            sink.write(t_new, y)
+
+    t_out, y_out = sink.result()
+    return t_out, y_out, _info(success, reason, nfev, newton)
+
+
+def backward_euler(f, x0, y0, h, n, jac=None, tol=1e-10, max_newton=10,
+                   every=1, out=None, block_size=BLOCK_SIZE):
+    """
+    Solve the ODE dy/dx = f(x, y) with the backward Euler method.
+
+    Each step solves y_{i+1} = y_i + h f(x_{i+1}, y_{i+1}) with a simplified
+    Newton iteration whose LU factorization is reused across steps (see the
+    module docstring). The method is first order and L-stable.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, y) returning dy/dx with the shape of y.
+    x0 : float
+        Initial value of x.
+    y0 : float or array_like
+        Initial value of y (a scalar or an array for a system of ODEs).
+    h : float
+        Step size.
+    n : int
+        Number of steps.
+    jac : callable, optional
+        Jacobian jac(x, y) of f as an (m, m) matrix for the flattened state. If
+        None, it is approximated by forward differences (m evaluations of f).
+    tol : float, optional
+        Newton tolerance on max|dz| relative to 1 + max|z| (default: 1e-10).
+    max_newton : int, optional
+        Maximum number of Newton iterations per attempt (default: 10).
+    every, out, block_size : optional
+        Output sink options, as in rk4.
+
+    Returns
+    -------
+    x_vals : numpy.ndarray
+        The x-values of the kept steps.
+    y_vals : numpy.ndarray
+        The solution, of shape (rows,) + shape of y0.
+    info : dict
+        'success', 'reason', 'nfev' (evaluations of f), 'n_jev' (Jacobian
+        evaluations), 'n_lu' (LU factorizations) and 'n_newton' (Newton
+        iterations). If Newton fails, or I - h J is singular, even with a
+        fresh Jacobian, the integration stops and success is False.
+
+    Example
+    -------
+    >>> x, y, info = backward_euler(lambda x, y: -y, 0, 1.0, 0.5, 2)
+    >>> y
+    array([1.        , 0.66666667, 0.44444444])
+    """
+    return _implicit_solve(f, x0, y0, h, n, 'euler', jac, tol, max_newton, every, out, block_size)
+
+
+def bdf2(f, x0, y0, h, n, jac=None, tol=1e-10, max_newton=10,
+         every=1, out=None, block_size=BLOCK_SIZE):
+    """
+    Solve the ODE dy/dx = f(x, y) with the two-step backward differentiation formula.
+
+    Each step solves y_{i+1} = (4 y_i - y_{i-1}) / 3 + 2/3 h f(x_{i+1}, y_{i+1})
+    with a simplified Newton iteration whose LU factorization is reused across
+    steps (see the module docstring); the first step is a backward Euler step.
+    The method is second order and L-stable.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, y) returning dy/dx with the shape of y.
+    x0 : float
+        Initial value of x.
+    y0 : float or array_like
+        Initial value of y (a scalar or an array for a system of ODEs).
+    h : float
+        Step size.
+    n : int
+        Number of steps.
+    jac : callable, optional
+        Jacobian jac(x, y) of f as an (m, m) matrix for the flattened state. If
+        None, it is approximated by forward differences (m evaluations of f).
+    tol : float, optional
+        Newton tolerance on max|dz| relative to 1 + max|z| (default: 1e-10).
+    max_newton : int, optional
+        Maximum number of Newton iterations per attempt (default: 10).
+    every, out, block_size : optional
+        Output sink options, as in rk4.
+
+    Returns
+    -------
+    x_vals : numpy.ndarray
+        The x-values of the kept steps.
+    y_vals : numpy.ndarray
+        The solution, of shape (rows,) + shape of y0.
+    info : dict
+        'success', 'reason', 'nfev', 'n_jev', 'n_lu' and 'n_newton', as in
+        backward_euler.
+
+    Example
+    -------
+    >>> x, y, info = bdf2(lambda x, y: -1000 * (y - np.cos(x)), 0, 0.0, 0.1, 10)
+    >>> abs(y[-1] - np.cos(1.0)) < 1e-3
+    True
+    """
+    return _implicit_solve(f, x0, y0, h, n, 'bdf2', jac, tol, max_newton, every, out, block_size)
+
+
+def rosenbrock(f, x0, y0, h, n, jac=None, jac_every=1, every=1, out=None, block_size=BLOCK_SIZE):
+    """
+    Solve the ODE dy/dx = f(x, y) with the two-stage Rosenbrock method ROS2.
+
+    With gamma = 1 + 1/sqrt(2) and M = I - h gamma J, each step solves
+
+        M k1 = f(x_i, y_i) + h gamma f_x
+        M k2 = f(x_i + h, y_i + h k1) - 2 k1 - h gamma f_x
+        y_{i+1} = y_i + 3/2 h k1 + 1/2 h k2
+
+    where f_x = df/dx is estimated by a forward difference whenever J is
+    evaluated. A step costs two evaluations of f and two solves with the same LU
+    factors (lu_pivot) and no Newton iteration. The method is second order
+    for any approximation of J and f_x, which is what allows them and the
+    factors of M to be kept for jac_every steps. It is L-stable when J is exact.
+
+    Because the nonlinear equations are not iterated, h must resolve fast
+    nonlinear transients (such as the start of Robertson's problem) that the
+    fully implicit backward_euler and bdf2 can step over.
+
+    Parameters
+    ----------
+    f : callable
+        Function f(x, y) returning dy/dx with the shape of y.
+    x0 : float
+        Initial value of x.
+    y0 : float or array_like
+        Initial value of y (a scalar or an array for a system of ODEs).
+    h : float
+        Step size.
+    n : int
+        Number of steps.
+    jac : callable, optional
+        Jacobian jac(x, y) of f as an (m, m) matrix for the flattened state. If
+        None, it is approximated by forward differences (m evaluations of f).
+    jac_every : int, optional
+        Re-evaluate J and f_x and refactorize M every jac_every steps (default: 1).
+    every, out, block_size : optional
+        Output sink options, as in rk4.
+
+    Returns
+    -------
+    x_vals : numpy.ndarray
+        The x-values of the kept steps.
+    y_vals : numpy.ndarray
+        The solution, of shape (rows,) + shape of y0.
+    info : dict
+        'success', 'reason', 'nfev', 'n_jev', 'n_lu' and 'n_newton' (always 0),
+        as in backward_euler. The integration stops with success False if M is
+        singular or the solution stops being finite.
+
+    Example
+    -------
+    >>> x, y, info = rosenbrock(lambda x, y: -1000 * (y - np.cos(x)), 0, 0.0, 0.01, 100)
+    >>> abs(y[-1] - np.cos(1.0)) < 1e-3
+    True
+    """
+    jac_every = int(jac_every)
+    if jac_every < 1:
+        raise ValueError("jac_every must be a positive integer.")
+    y0, fun, jac_flat, nfev = _flat_problem(f, y0, jac)
+    n = int(n)
+    gamma = 1 + 1 / np.sqrt(2)
+    hg = h * gamma
+    cache = _NewtonSolver(fun, jac_flat, 0.0, 0)
+    sink = OutputSink(n, every, out, y0.shape, y0.dtype, block_size)
+
+    y = y0.ravel().copy()
+    sink.write(x0, y)
+    success, reason = True, "Completed all steps"
+    for i in range(n):
+        t, t_new = x0 + i * h, x0 + (i + 1) * h
+        refresh = i % jac_every == 0
+        fy = fun(t, y)
+        if refresh:
+            dt = np.sqrt(np.finfo(float).eps) * max(1.0, abs(t))
+            fx = (fun(t + dt, y) - fy) / dt
+        try:
+            cache.factors(t, y, hg, refresh=refresh)
+        except _SingularMatrix as e:
+            success, reason = False, f"{e} at step {i + 1} (t = {t_new})"
+            break
+        L, U, perm = cache.LU
+        k1 = lu_solve(L, U, fy + hg * fx, perm)
+        k2 = lu_solve(L, U, fun(t_new, y + h * k1) - 2 * k1 - hg * fx, perm)
+        y_new = y + 1.5 * h * k1 + 0.5 * h * k2
+        if not np.all(np.isfinite(y_new)):
+            success, reason = False, f"Solution is not finite at step {i + 1} (t = {t_new})"
+            break
+        y = y_new
+        if sink.wants(i + 1):
+            sink.write(t_new, y)
+
+    t_out, y_out = sink.result()
+    return t_out, y_out, _info(success, reason, nfev, cache)
+
+
+# Example demonstration
+if __name__ == "__main__":
+    import time
+    from .rk4 import rk4
+
+    # Robertson's chemical kinetics problem: rate constants spanning nine orders of magnitude
+    def robertson(t, y):
+        return np.array([-0.04 * y[0] + 1e4 * y[1] * y[2],
+                         0.04 * y[0] - 1e4 * y[1] * y[2] - 3e7 * y[1]**2,
+                         3e7 * y[1]**2])
+
+    def robertson_jac(t, y):
+        return np.array([[-0.04, 1e4 * y[2], 1e4 * y[1]],
+                         [0.04, -1e4 * y[2] - 6e7 * y[1], -1e4 * y[1]],
+                         [0.0, 6e7 * y[1], 0.0]])
+
+    y0 = [1.0, 0.0, 0.0]
+    for name, solver in (('backward_euler', backward_euler), ('bdf2', bdf2)):
+        start = time.perf_counter()
+        t, y, info = solver(robertson, 0, y0, 1e-2, 4000, jac=robertson_jac)
+        print(f"{name:14s} h = 1e-2, 4000 steps: {time.perf_counter() - start:.2f} s, y(40) = {y[-1]}, "
+              f"{info['n_lu']} LU factorizations, {info['n_newton']} Newton iterations ({info['reason']})")
+
+    # The Rosenbrock method does not iterate, so the step must resolve the initial transient
+    start = time.perf_counter()
+    t, y, info = rosenbrock(robertson, 0, y0, 1e-3, 40000, jac=robertson_jac, jac_every=20)
+    print(f"{'rosenbrock':14s} h = 1e-3, 40000 steps: {time.perf_counter() - start:.2f} s, y(40) = {y[-1]}, "
+          f"{info['n_lu']} LU factorizations ({info['reason']})")
+
+    # The explicit method is unstable at this step size
+    with np.errstate(all='ignore'):
+        t, y = rk4(robertson, 0, y0, 1e-2, 100)
+    print(f"rk4            h = 1e-2: y(1) = {y[-1]}")
@@ -8,10 +8,12 @@ setup(
     author_email="btanish23@iitk.ac.in, shobhitg23@iitk.ac.in",
     packages=find_packages(),
     install_requires=[
-        "numpy",
-        "matplotlib"
+        "numpy>=1.20"
     ],
-    python_requires=">=3.7",
+    extras_require={
+        "plot": ["matplotlib"]
+    },
+    python_requires=">=3.8",
     classifiers=[
         "Programming Language :: Python :: 3",
         "License :: OSI Approved :: MIT License",
@@ -1,13 +1,77 @@
 import unittest
 import numpy as np
 from mth308 import (
-    bisection_method, trapezoidal_rule, divided_difference_table, newton_divided_diff,
-    euler_method, gauss_seidel, gaussian_elimination, jacobi, lu_doolittle, lu_crout,
-    modified_regula_falsi, newton_raphson, power_method, regula_falsi, rk4,
-    secant_method, simpsons_one_third, sor_solver
+    bisection_method, trapezoidal_rule, romberg, divided_difference_table, newton_divided_diff,
+    newton_coefficients, NewtonInterpolant,
+    barycentric_weights, chebyshev_nodes, chebyshev_weights, BarycentricInterpolant, chebyshev_interpolant,
+    LinearSpline, CubicSpline,
+    euler_method, gauss_seidel, gaussian_elimination, jacobi, block_jacobi, lu_doolittle, lu_crout,
+    lu_pivot, lu_solve, solve, inspect_matrix, bandwidth, to_banded, banded_solve, tridiagonal_solve,
+    cholesky, ldl, is_positive_definite,
+    modified_regula_falsi, newton_raphson, power_method, regula_falsi, rk4, rk45,
+    secant_method, simpsons_one_third, adaptive_simpson, sor_solver,
+    gauss_legendre, gauss_legendre_nodes, trapezoid_samples, simpson_samples,
+    tensor_cubature, sobol, halton, qmc_integrate, ensemble_solve,
+    backward_euler, bdf2, rosenbrock, SolverResult, IterationProfiler
 )
 
+def _harmonic_ensemble(t, Y):
+    # Module level so that it can be sent to worker processes
+    return np.stack((Y[:, 1], -Y[:, 0]), axis=1)
+
+
 class TestMth308Lib(unittest.TestCase):
+    def test_lazy_import(self):
+        import os
+        import subprocess
+        import sys
+        code = ("import sys, mth308; print('numpy' in sys.modules, 'matplotlib' in sys.modules); "
+                "from mth308 import rk45; import mth308.cholesky; "
+                "print(callable(mth308.rk4), callable(mth308.cholesky), 'matplotlib' in sys.modules)")
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        out = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=root)
+        self.assertEqual(out.stdout.split(), ['False', 'False', 'True', 'True', 'False'])
+        import mth308
+        self.assertIn('solve', dir(mth308))
+        with self.assertRaises(AttributeError):
+            mth308.no_such_function
+
+    def test_benchmark_coverage(self):
+        import importlib.util
+        import os
+        import mth308
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        spec = importlib.util.spec_from_file_location('cases', os.path.join(root, 'benchmarks', 'cases.py'))
+        cases = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(cases)
+        covered = {c.name.split('[')[0] for c in cases.CASES}
+        self.assertEqual(set(mth308.__all__) - covered, set())
+        run, counter = next(c for c in cases.CASES if c.name == 'simpsons_one_third').setup(100)
+        run()
+        self.assertEqual(counter.points, 101)
+
+    def test_banded_solve(self):
+        rng = np.random.default_rng(0)
+        A = np.triu(np.tril(rng.normal(size=(3, 20, 20)), 2), -3)
+        B = rng.normal(size=(3, 20, 2))
+        self.assertEqual(bandwidth(A[0]), (3, 2))
+        with self.assertRaises(ValueError):
+            bandwidth(3.0)
+        X = banded_solve(to_banded(A, 3, 2), B, 3, 2)
+        self.assertTrue(np.allclose(X, np.linalg.solve(A, B)))
+        x = banded_solve(A[0], B[0, :, 0])
+        self.assertTrue(np.allclose(A[0] @ x, B[0, :, 0]))
+
+    def test_tridiagonal_solve(self):
+        n = 200
+        dl, du = -np.ones(n - 1), -np.ones(n - 1)
+        d = 4 * np.ones(n)
+        A = np.diag(d) + np.diag(dl, -1) + np.diag(du, 1)
+        b = np.arange(n, dtype=float)
+        for method in ('thomas', 'cr'):
+            x = tridiagonal_solve(dl, d, du, b, method=method)
+            self.assertTrue(np.allclose(A @ x, b))
+
     def test_bisection_method(self):
         f = lambda x: x**2 - 2
         root, iterations, converged = bisection_method(f, 0, 2, N=50, eps=1e-8)
@@ -18,6 +82,111 @@ class TestMth308Lib(unittest.TestCase):
         result = trapezoidal_rule(lambda x: x**2, 0, 2, N=100)
         self.assertAlmostEqual(result, 8/3, places=2)
 
+    def test_cholesky(self):
+        rng = np.random.default_rng(0)
+        B = rng.normal(size=(70, 70))
+        A = B @ B.T + 70 * np.eye(70)
+        factor = cholesky(A, block_size=16)
+        self.assertTrue(np.allclose(factor.L @ factor.L.T, A))
+        self.assertEqual(factor.packed.size, 70 * 71 // 2)
+        b = rng.normal(size=(70, 2))
+        self.assertTrue(np.allclose(factor.solve(b), np.linalg.solve(A, b)))
+        self.assertTrue(is_positive_definite(A))
+        self.assertFalse(is_positive_definite([[1.0, 2.0], [2.0, 1.0]]))
+        with self.assertRaises(ValueError):
+            cholesky([[1.0, 2.0], [2.0, 1.0]])
+
+    def test_ldl(self):
+        S = np.array([[4.0, 1.0, 2.0], [1.0, -3.0, 0.5], [2.0, 0.5, 2.0]])
+        factor = ldl(S)
+        self.assertTrue(np.allclose(factor.L @ np.diag(factor.D) @ factor.L.T, S))
+        self.assertTrue(np.allclose(factor.solve([1.0, 2.0, 3.0]), np.linalg.solve(S, [1.0, 2.0, 3.0])))
+
+    def test_trapezoidal_rule_vectorized(self):
+        scalar = trapezoidal_rule(lambda x: x**3, 0, 2, N=1001)
+        vectorized = trapezoidal_rule(lambda x: x**3, 0, 2, N=1001, vectorized=True, chunk_size=100)
+        self.assertAlmostEqual(scalar, vectorized, places=12)
+        # math.sin rejects arrays, so the scalar loop is used
+        import math
+        fallback = trapezoidal_rule(math.sin, 0, math.pi, N=100, vectorized=True)
+        self.assertAlmostEqual(fallback, trapezoidal_rule(math.sin, 0, math.pi, N=100), places=14)
+
+    def test_romberg(self):
+        integral, info = romberg(np.exp, 0, 1, tol=1e-12)
+        self.assertTrue(info['converged'])
+        self.assertAlmostEqual(integral, np.e - 1, places=12)
+        self.assertEqual(info['n_evals'], 2**(info['levels'] - 1) + 1)
+        vectorized, _ = romberg(np.exp, 0, 1, tol=1e-12, vectorized=True)
+        self.assertAlmostEqual(vectorized, integral, places=14)
+
+    def test_gauss_legendre(self):
+        x, w = gauss_legendre_nodes(7)
+        self.assertAlmostEqual(w.sum(), 2.0, places=14)
+        self.assertAlmostEqual(np.dot(w, x**12), 2 / 13, places=14)
+        self.assertIs(gauss_legendre_nodes(7)[0], x)
+        self.assertAlmostEqual(gauss_legendre(np.exp, 0, 1, n=8), np.e - 1, places=14)
+        import math
+        self.assertAlmostEqual(gauss_legendre(math.sin, 0, math.pi, n=5, panels=6), 2.0, places=10)
+
+    def test_batched_quadrature(self):
+        a = np.linspace(0.5, 3, 7)
+        b = a[::-1]
+        f = lambda x, a, b: np.exp(-a * x) * np.cos(b * x)
+        batched = simpsons_one_third(f, 0, 2, N=200, params=(a, b), chunk_size=50)
+        single = [simpsons_one_third(lambda x: f(x, ai, bi), 0, 2, N=200, vectorized=True) for ai, bi in zip(a, b)]
+        self.assertTrue(np.allclose(batched, single, rtol=0, atol=1e-14))
+        batched = trapezoidal_rule(lambda x, k: x**k, 0, 1, N=100, params=[1, 2])
+        self.assertAlmostEqual(batched[1], trapezoidal_rule(lambda x: x**2, 0, 1, N=100), places=14)
+        with self.assertRaises(ValueError):
+            trapezoidal_rule(lambda x, k: k * np.ones(3), 0, 1, N=10, params=[1, 2])
+
+    def test_parallel_quadrature(self):
+        import math
+        serial = simpsons_one_third(math.exp, 0, 1, N=1000)
+        parallel = simpsons_one_third(math.exp, 0, 1, N=1000, n_workers=2, chunk_size=64)
+        self.assertAlmostEqual(parallel, serial, places=14)
+        parallel = trapezoidal_rule(np.cos, 0, 1, N=999, n_workers=2, vectorized=True)
+        self.assertAlmostEqual(parallel, trapezoidal_rule(np.cos, 0, 1, N=999), places=14)
+
+    def test_tensor_cubature(self):
+        f = lambda x, y, z: np.exp(x + 2 * y) * z
+        exact = (np.e - 1) * (np.e**2 - 1) / 2 * 2
+        self.assertAlmostEqual(tensor_cubature(f, [(0, 1), (0, 1), (0, 2)], n=10, chunk_size=100), exact, places=12)
+        simpson = tensor_cubature(f, [(0, 1), (0, 1), (0, 2)], n=[20, 20, 2], rule='simpson')
+        self.assertAlmostEqual(simpson, exact, places=4)
+        import math
+        scalar = tensor_cubature(lambda x, y: math.sin(x) * y, [(0, 1), (0, 1)], n=5)
+        self.assertAlmostEqual(scalar, (1 - math.cos(1)) / 2, places=12)
+
+    def test_qmc_integrate(self):
+        self.assertTrue(np.array_equal(sobol(4, 3)[:, 2], [0, 0.5, 0.25, 0.75]))
+        self.assertTrue(np.allclose(halton(3, 2)[:, 1], [1 / 3, 2 / 3, 1 / 9]))
+        f = lambda *x: np.prod([1 + (xk - 0.5) for xk in x], axis=0)
+        for method in ('sobol', 'halton'):
+            value, info = qmc_integrate(f, [(0, 1)] * 5, n=2**12, method=method, seed=0)
+            self.assertLess(abs(value - 1.0), 10 * info['error'] + 1e-12)
+            self.assertEqual(info['n_evals'], 8 * 2**12)
+        value, info = qmc_integrate(f, [(0, 1)] * 5, n=2**16, tol=1e-3, batch_size=1024, seed=0)
+        self.assertTrue(info['converged'])
+        self.assertLess(info['n_evals'], 8 * 2**16)
+
+    def test_sampled_integration(self):
+        import os
+        import tempfile
+        x = np.sort(np.random.default_rng(0).uniform(0, 2, 501))
+        x[0], x[-1] = 0.0, 2.0
+        y = np.exp(x)
+        self.assertAlmostEqual(trapezoid_samples(y, x, chunk_size=16), np.sum(np.diff(x) * (y[1:] + y[:-1]) / 2), places=12)
+        self.assertAlmostEqual(simpson_samples(y, x, chunk_size=16), np.exp(2) - 1, places=5)
+        xu = np.linspace(0, 2, 102)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "y.npy")
+            np.save(path, np.exp(xu))
+            self.assertAlmostEqual(simpson_samples(path, dx=xu[1], chunk_size=10), np.exp(2) - 1, places=6)
+            running = trapezoid_samples(path, dx=xu[1], cumulative=True, chunk_size=10)
+        self.assertTrue(np.allclose(running, np.exp(xu) - 1, atol=1e-3))
+        self.assertEqual(simpson_samples([0, 1, 4, 9, 16]), 64 / 3)
+
     def test_divided_difference_table(self):
         x = [1, 2, 4]
         y = [1, 4, 16]
@@ -30,6 +199,63 @@ class TestMth308Lib(unittest.TestCase):
         table = newton_divided_diff(x, y)
         self.assertAlmostEqual(table[2,2], 1.0, places=7)
 
+    def test_newton_coefficients(self):
+        x = np.array([0.0, 0.5, 1.5, 2.0, 3.5])
+        y = np.cos(x)
+        coef = newton_coefficients(x, y)
+        self.assertTrue(np.allclose(coef, np.diag(divided_difference_table(x, y))))
+
+    def test_newton_interpolant(self):
+        x = np.linspace(-1, 1, 8)
+        p = NewtonInterpolant(x, x**5 - 2*x**3)
+        t = np.linspace(-1, 1, 50).reshape(5, 10)
+        self.assertEqual(p(t).shape, (5, 10))
+        self.assertTrue(np.allclose(p(t), t**5 - 2*t**3))
+        self.assertTrue(np.allclose(p(t, der=1), 5*t**4 - 6*t**2))
+        self.assertTrue(np.allclose(p.derivative(t, 2), 20*t**3 - 12*t))
+        self.assertAlmostEqual(p(0.5), 0.5**5 - 2*0.5**3)
+
+    def test_newton_interpolant_append(self):
+        x = np.array([0.3, -0.7, 1.1, 0.0, 2.0, -1.5])
+        y = np.exp(x)
+        p = NewtonInterpolant()
+        for i in range(len(x)):
+            p.append(x[i], y[i])
+            self.assertTrue(np.allclose(p(x[:i+1]), y[:i+1]))
+        self.assertTrue(np.allclose(p.coef, newton_coefficients(x, y)))
+        with self.assertRaises(ValueError):
+            p.append(0.3, 1.0)
+
+    def test_barycentric_interpolant(self):
+        x = np.array([0.0, 0.4, 1.0, 1.7, 2.5])
+        p = BarycentricInterpolant(x, x**4 - x)
+        t = np.linspace(0, 2.5, 23)
+        self.assertTrue(np.allclose(p(t), t**4 - t))
+        self.assertAlmostEqual(p(1.0), 0.0)
+        xc = chebyshev_nodes(9, kind=1)
+        ratio = barycentric_weights(xc) / chebyshev_weights(9, kind=1)
+        self.assertTrue(np.allclose(ratio, ratio[0]))
+
+    def test_chebyshev_interpolant(self):
+        runge = lambda x: 1 / (1 + 25 * x**2)
+        p = chebyshev_interpolant(runge, 300, -1, 1)
+        t = np.linspace(-1, 1, 1001)
+        self.assertLess(np.max(np.abs(p(t) - runge(t))), 1e-12)
+
+    def test_cubic_spline(self):
+        x = np.linspace(0, 3, 7)
+        s = CubicSpline(x, x**3, bc=('clamped', 0.0, 27.0))
+        t = np.linspace(-0.5, 3.5, 41)
+        self.assertTrue(np.allclose(s(t), t**3))
+        self.assertTrue(np.allclose(s(t, der=1), 3 * t**2))
+        natural = CubicSpline(x, np.sin(x))
+        self.assertTrue(np.allclose(natural(x), np.sin(x)))
+        self.assertTrue(np.allclose(natural([0.0, 3.0], der=2), 0.0))
+
+    def test_linear_spline(self):
+        s = LinearSpline([0, 1, 3], [0, 2, 3])
+        self.assertTrue(np.allclose(s([0.5, 2.0, 3.0]), [1.0, 2.5, 3.0]))
+
     def test_euler_method(self):
         f = lambda t, y: y
         t, w = euler_method(f, 0, 1, 1, N=10)
@@ -57,16 +283,51 @@ class TestMth308Lib(unittest.TestCase):
         X = jacobi(A, b, x0, max_iter=5)
         self.assertEqual(X.shape[0], 3)
 
+    def test_block_jacobi(self):
+        n = 12
+        A = 6 * np.eye(n) - np.eye(n, k=1) - np.eye(n, k=-1) - np.eye(n, k=2) - np.eye(n, k=-2)
+        b = np.arange(1.0, n + 1)
+        x, iterations, converged = block_jacobi(A, b, block_size=4, n_workers=2, max_iter=200)
+        self.assertTrue(converged)
+        self.assertTrue(np.allclose(x, np.linalg.solve(A, b)))
+        # Blocks only read the columns inside an unsymmetric band
+        A = 6 * np.eye(n) - np.eye(n, k=1) - 2 * np.eye(n, k=-5)
+        x, iterations, converged = block_jacobi(A, b, block_size=3, n_workers=2, max_iter=200)
+        self.assertTrue(converged)
+        self.assertTrue(np.allclose(x, np.linalg.solve(A, b)))
+
     def test_lu_doolittle(self):
         A = np.array([[4, 3], [6, 3]], dtype=float)
         L, U = lu_doolittle(A)
         self.assertTrue(np.allclose(np.dot(L, U), A))
+        # A zero last pivot (singular matrix) is detected too
+        with self.assertRaises(ValueError):
+            lu_doolittle(np.array([[1.0, 2.0], [2.0, 4.0]]))
+        with self.assertRaises(ValueError):
+            lu_solve(np.eye(2), np.array([[1.0, 2.0], [0.0, 0.0]]), [1.0, 2.0])
+
+    def test_lu_pivot(self):
+        # A zero leading pivot needs a row exchange
+        A = np.array([[0.0, 1.0, 2.0], [2.0, 1.0, 0.0], [1.0, 3.0, 1.0]])
+        L, U, perm = lu_pivot(A)
+        self.assertTrue(np.allclose(L @ U, A[perm]))
+        self.assertTrue(np.all(np.abs(L) <= 1))
+        b = np.array([1.0, 2.0, 3.0])
+        self.assertTrue(np.allclose(lu_solve(L, U, b, perm), np.linalg.solve(A, b)))
+        with self.assertRaises(ValueError):
+            lu_pivot(np.array([[1.0, 2.0], [2.0, 4.0]]))
 
     def test_lu_crout(self):
         A = np.array([[4, 3], [6, 3]], dtype=float)
         L, U = lu_crout(A)
         self.assertTrue(np.allclose(np.dot(L, U), A))
 
+    def test_lu_solve(self):
+        A = np.array([[4, 3, 1], [6, 3, 2], [1, 2, 5]], dtype=float)
+        L, U = lu_doolittle(A)
+        B = np.array([[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]])
+        self.assertTrue(np.allclose(lu_solve(L, U, B), np.linalg.solve(A, B)))
+
     def test_modified_regula_falsi(self):
         f = lambda x: x**2 - 2
         root = modified_regula_falsi(f, 0, 2, tol=1e-8)
@@ -97,16 +358,239 @@ class TestMth308Lib(unittest.TestCase):
         self.assertEqual(len(x_vals), 11)
         self.assertEqual(len(y_vals), 11)
 
+    def test_rk45(self):
+        A = np.array([[0.0, 1.0], [-1.0, 0.0]])
+        t_eval = np.linspace(0, 10, 101)
+        t, y, info = rk45(lambda t, y: A @ y, 0, [1.0, 0.0], 10, rtol=1e-10, atol=1e-12, t_eval=t_eval)
+        self.assertTrue(info['success'])
+        self.assertEqual(y.shape, (101, 2))
+        self.assertTrue(np.allclose(y[:, 0], np.cos(t_eval), atol=1e-8))
+        self.assertEqual(info['nfev'], 6 * (info['n_accepted'] + info['n_rejected']) + 2)
+        t, y, info = rk45(lambda t, y: -50 * (y - np.cos(t)), 0, 1.0, 2.0)
+        self.assertEqual(t[-1], 2.0)
+        self.assertGreater(np.max(np.diff(t)) / np.min(np.diff(t)), 10)
+        # A failed integration returns only the output times it reached
+        t, y, info = rk45(lambda t, y: A @ y, 0, [1.0, 0.0], 10, t_eval=t_eval, max_steps=5)
+        self.assertFalse(info['success'])
+        self.assertEqual(len(t), len(y))
+        self.assertLess(len(t), len(t_eval))
+        self.assertTrue(np.allclose(y[:, 0], np.cos(t), atol=1e-4))
+
+    def test_ode_output_sinks(self):
+        import os
+        import tempfile
+        f = lambda t, y: np.array([y[1], -y[0]])
+        x_all, y_all = rk4(f, 0, [1.0, 0.0], 0.01, 100)
+        x, y = rk4(f, 0, [1.0, 0.0], 0.01, 100, every=7)
+        self.assertEqual(len(x), 16)
+        self.assertTrue(np.array_equal(y[:-1], y_all[::7]))
+        self.assertTrue(np.array_equal(y[-1], y_all[-1]))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "trajectory.npy")
+            rk4(f, 0, [1.0, 0.0], 0.01, 100, every=7, out=path, block_size=4)
+            stored = np.load(path)
+        self.assertTrue(np.allclose(stored[:, 0], x))
+        self.assertTrue(np.array_equal(stored[:, 1:], y))
+        blocks = []
+        t_end, w_end = euler_method(f, 0, 1, [1.0, 0.0], N=100, every=10, block_size=4,
+                                    out=lambda t, w: blocks.append(w))
+        _, w = euler_method(f, 0, 1, [1.0, 0.0], N=100)
+        self.assertTrue(np.array_equal(np.concatenate(blocks), w[::10]))
+        self.assertEqual(t_end, 1.0)
+        self.assertTrue(np.array_equal(w_end, w[-1]))
+
+    def test_stiff_solvers(self):
+        x, y, info = backward_euler(lambda x, y: -y, 0, 1.0, 0.5, 2)
+        self.assertTrue(np.allclose(y, [1, 2 / 3, 4 / 9]))
+        f = lambda t, y: np.array([-1000 * (y[0] - np.cos(t)), y[0] - y[1]])
+        errors = []
+        for h in (0.02, 0.01):
+            t, y, info = bdf2(f, 0, [0.0, 0.0], h, int(round(1 / h)))
+            self.assertTrue(info['success'])
+            self.assertLessEqual(info['n_lu'], 3)
+            errors.append(abs(y[-1, 0] - (1e6 * np.cos(1.0) + 1e3 * np.sin(1.0)) / (1e6 + 1)))
+        self.assertLess(errors[1], errors[0] / 3)
+        jac = lambda t, y: np.array([[-1000.0, 0.0], [1.0, -1.0]])
+        _, y_jac, info = bdf2(f, 0, [0.0, 0.0], 0.01, 100, jac=jac)
+        self.assertTrue(np.allclose(y_jac, y, atol=1e-8))
+        self.assertEqual(info['nfev'], info['n_newton'])
+        # I - hJ = [[0, -0.5], [-0.5, 1]] is nonsingular but needs a row exchange
+        J = np.array([[2.0, 1.0], [1.0, 0.0]])
+        _, y, info = backward_euler(lambda t, y: J @ y, 0, [1.0, 1.0], 0.5, 1, jac=lambda t, y: J)
+        self.assertTrue(info['success'])
+        self.assertTrue(np.allclose(y[-1], np.linalg.solve(np.eye(2) - 0.5 * J, [1.0, 1.0])))
+
+    def test_rosenbrock(self):
+        f = lambda t, y: np.array([-1000 * (y[0] - np.cos(t)), y[0] - y[1]])
+        jac = lambda t, y: np.array([[-1000.0, 0.0], [1.0, -1.0]])
+        errors = []
+        for h in (0.02, 0.01):
+            t, y, info = rosenbrock(f, 0, [0.0, 0.0], h, int(round(1 / h)), jac=jac, jac_every=10)
+            self.assertTrue(info['success'])
+            errors.append(abs(y[-1, 0] - (1e6 * np.cos(1.0) + 1e3 * np.sin(1.0)) / (1e6 + 1)))
+        self.assertLess(errors[1], errors[0] / 3)
+        self.assertEqual((info['n_lu'], info['nfev']), (10, 210))
+
+        def robertson(t, y):
+            return np.array([-0.04 * y[0] + 1e4 * y[1] * y[2],
+                             0.04 * y[0] - 1e4 * y[1] * y[2] - 3e7 * y[1]**2, 3e7 * y[1]**2])
+        _, y, info = rosenbrock(robertson, 0, [1.0, 0.0, 0.0], 1e-3, 1000, jac_every=10)
+        _, y_ref, _ = bdf2(robertson, 0, [1.0, 0.0, 0.0], 1e-3, 1000)
+        self.assertTrue(info['success'])
+        self.assertEqual(info['n_lu'], 100)
+        self.assertAlmostEqual(y[-1].sum(), 1.0, places=12)
+        self.assertTrue(np.allclose(y[-1], y_ref[-1], rtol=1e-4, atol=1e-9))
+
+        # A singular iteration matrix stops the integration instead of raising
+        for solve in (backward_euler, rosenbrock):
+            h = 0.125
+            gamma = 1.0 if solve is backward_euler else 1 + 1 / np.sqrt(2)
+            t, y, info = solve(lambda t, y: y / (h * gamma), 0, 1.0, h, 5, jac=lambda t, y: [[1 / (h * gamma)]])
+            self.assertFalse(info['success'])
+            self.assertIn('singular', info['reason'])
+            self.assertEqual(len(y), 1)
+
+    def test_ensemble_solve(self):
+        Y0 = np.random.default_rng(0).normal(size=(50, 2))
+        x, Y = ensemble_solve(_harmonic_ensemble, 0, Y0, 0.01, 100, chunk_size=16)
+        _, y = rk4(lambda t, y: np.array([y[1], -y[0]]), 0, Y0[7], 0.01, 100)
+        self.assertTrue(np.allclose(Y[7], y[-1], rtol=0, atol=1e-14))
+        _, parallel = ensemble_solve(_harmonic_ensemble, 0, Y0, 0.01, 100, chunk_size=16, n_workers=2)
+        self.assertTrue(np.array_equal(parallel, Y))
+        _, traj = ensemble_solve(_harmonic_ensemble, 0, Y0, 0.01, 100, method='euler', chunk_size=16,
+                                 trajectory=True)
+        self.assertEqual(traj.shape, (101, 50, 2))
+        _, w = euler_method(lambda t, y: np.array([y[1], -y[0]]), 0, 1, Y0[7], N=100)
+        self.assertTrue(np.allclose(traj[:, 7], w))
+        self.assertTrue(np.allclose(traj[1], Y0 + 0.01 * _harmonic_ensemble(0, Y0)))
+
+    def test_ode_systems(self):
+        A = np.array([[0.0, 1.0], [-1.0, 0.0]])
+        f = lambda t, y: A @ y
+        x_vals, y_vals = rk4(f, 0, [1.0, 0.0], 0.01, 100)
+        self.assertEqual(y_vals.shape, (101, 2))
+        self.assertTrue(np.allclose(y_vals[-1], [np.cos(1), -np.sin(1)], atol=1e-9))
+        t, w = euler_method(f, 0, 1, [1.0, 0.0], N=10)
+        self.assertEqual(w.shape, (11, 2))
+        self.assertTrue(np.allclose(w[1], [1.0, -0.1]))
+        x_vals, y_vals = rk4(lambda x, y: -y, 0, np.ones((2, 3)), 0.1, 10)
+        self.assertEqual(y_vals.shape, (11, 2, 3))
+        self.assertTrue(np.allclose(y_vals[-1], np.exp(-1), atol=1e-6))
+
     def test_secant_method(self):
         f = lambda x: x**2 - 2
         root, history, message = secant_method(f, 0, 2, tol=1e-8, max_iter=20)
         self.assertIsNotNone(root)
         self.assertAlmostEqual(root, np.sqrt(2), places=7)
 
+    def test_solver_result(self):
+        f = lambda x: x**2 - 2
+        calls = []
+        counted = lambda x: calls.append(x) or f(x)
+        results = [bisection_method(counted, 0, 2, eps=1e-10, return_result=True),
+                   regula_falsi(counted, 0, 2, tol=1e-10, return_result=True),
+                   modified_regula_falsi(counted, 0, 2, tol=1e-10, return_result=True),
+                   secant_method(counted, 0, 2, tol=1e-10, return_result=True)]
+        self.assertEqual(sum(r.n_fevals for r in results), len(calls))
+        for r in results:
+            self.assertIsInstance(r, SolverResult)
+            self.assertTrue(r.converged)
+            self.assertAlmostEqual(r.solution, np.sqrt(2), places=8)
+            self.assertLess(r.residual, 1e-6)
+            self.assertGreaterEqual(r.wall_time, 0)
+        r = newton_raphson(f, lambda x: 0 * x, 1.0, return_result=True)
+        self.assertEqual((r.solution, r.status, r.converged), (None, 'zero derivative', False))
+        with self.assertRaises(AttributeError):
+            r.extra = 1
+
+        A = np.array([[4.0, 1.0, 1.0], [1.0, 3.0, 1.0], [1.0, 1.0, 5.0]])
+        b = np.array([7.0, 8.0, 11.0])
+        r = gauss_seidel(A, b, max_iter=100, return_result=True)
+        self.assertTrue(r.converged)
+        self.assertTrue(np.allclose(A @ r.solution, b))
+        self.assertEqual(block_jacobi(A, b, block_size=1, max_iter=5, return_result=True).status, 'max_iter')
+        r = sor_solver(A, b, np.zeros(3), 1.1, 50, return_result=True)
+        self.assertLess(r.residual, 1e-8)
+        self.assertLess(jacobi(A, b, np.zeros(3), 60, return_result=True).residual, 1e-8)
+        r = power_method(np.array([[2.0, 0.0], [0.0, 1.0]]), np.ones(2), tol=1e-10, return_result=True)
+        self.assertAlmostEqual(r.solution[0], 2, places=8)
+        self.assertEqual(r.n_fevals, r.iterations)
+
+    def test_iteration_profiler(self):
+        with IterationProfiler(keep_iterates=True) as prof:
+            X, converged = gauss_seidel([[4, 1], [1, 3]], [1, 2], max_iter=50, callback=prof)
+        self.assertTrue(converged)
+        self.assertEqual(prof.iterations, list(range(1, X.shape[1])))
+        self.assertTrue(np.allclose(np.array(prof.iterates).T, X[:, 1:]))
+        self.assertEqual(len(prof.intervals), len(prof.iterations))
+        self.assertAlmostEqual(prof.intervals.sum(), prof.total)
+        root, info = newton_raphson(lambda x: x**2 - 2, lambda x: 2 * x, 1.5, callback=prof)
+        self.assertEqual(prof.iterations[-info['iterations']:], list(range(1, info['iterations'] + 1)))
+
+    def test_inspect_matrix(self):
+        A = np.array([[4.0, 1.0, 0.0], [1.0, 4.0, 1.0], [0.0, 1.0, 4.0]])
+        info = inspect_matrix(A)
+        self.assertEqual((info['lower_bandwidth'], info['upper_bandwidth']), (1, 1))
+        self.assertTrue(info['symmetric'])
+        self.assertTrue(info['diagonally_dominant'])
+        self.assertAlmostEqual(info['density'], 7 / 9)
+
+    def test_solve(self):
+        x, info = solve([[0.0, 1.0], [2.0, 1.0]], [1.0, 3.0])
+        self.assertEqual(info['method'], 'lu_pivot')
+        self.assertTrue(np.allclose(x, [1.0, 1.0]))
+        # Tiny pivots need row exchanges, also after a failed Cholesky factorization
+        x, info = solve([[1e-17, 1, 0.5], [2, 1, 0.3], [0.1, 3, 1]], [1, 2, 3])
+        self.assertTrue(np.allclose(x, [25 / 49, 93 / 98, 5 / 49]))
+        x, info = solve([[1e-20, 1.0], [1.0, 1.0]], [1.0, 2.0])
+        self.assertEqual(info['fallbacks'], ['cholesky'])
+        self.assertTrue(np.allclose(x, [1.0, 1.0]))
+        with self.assertRaises(ValueError):
+            solve([[1.0, 2.0], [2.0, 4.0]], [1.0, 2.0])
+        with self.assertRaises(ValueError):
+            inspect_matrix(3.0)
+        S = np.array([[4.0, 2.0, 1.0], [2.0, 5.0, 3.0], [1.0, 3.0, 6.0]])
+        x, info = solve(S, [1.0, 2.0, 3.0])
+        self.assertEqual(info['method'], 'cholesky')
+        self.assertTrue(np.allclose(S @ x, [1.0, 2.0, 3.0]))
+        n = 300
+        A = np.ones((n, n)) + n * np.eye(n)
+        b = np.ones(n)
+        x, info = solve(A, b)
+        self.assertEqual(info['method'], 'block_jacobi')
+        self.assertTrue(np.allclose(A @ x, b))
+        A = 4 * np.eye(n) + np.eye(n, k=1) + np.eye(n, k=-1)
+        x, info = solve(A, b)
+        self.assertEqual(info['method'], 'tridiagonal_solve')
+        self.assertTrue(np.allclose(A @ x, b))
+        A = A + 0.5 * np.eye(n, k=-3)
+        x, info = solve(A, b)
+        self.assertEqual(info['method'], 'banded_solve')
+        self.assertTrue(np.allclose(A @ x, b))
+
     def test_simpsons_one_third(self):
         result = simpsons_one_third(lambda x: x**2, 0, 2, N=100)
         self.assertAlmostEqual(result, 8/3, places=2)
 
+    def test_simpsons_one_third_vectorized(self):
+        scalar = simpsons_one_third(np.exp, 0, 1, N=1000)
+        vectorized = simpsons_one_third(np.exp, 0, 1, N=1000, vectorized=True, chunk_size=333)
+        self.assertAlmostEqual(scalar, vectorized, places=12)
+        fallback = simpsons_one_third(lambda x: x if x > 0.5 else 0.5, 0, 1, N=10, vectorized=True)
+        self.assertAlmostEqual(fallback, simpsons_one_third(lambda x: x if x > 0.5 else 0.5, 0, 1, N=10), places=14)
+
+    def test_adaptive_simpson(self):
+        peak = lambda x: 1 / (1e-6 + x**2)
+        exact = 2 * 1000 * np.arctan(1000)
+        integral, info = adaptive_simpson(peak, -1, 1, tol=1e-6)
+        self.assertTrue(info['converged'])
+        self.assertLess(abs(integral - exact), 1e-6)
+        uniform = simpsons_one_third(peak, -1, 1, N=info['n_evals'] - info['n_evals'] % 2)
+        self.assertGreater(abs(uniform - exact), 1e3 * abs(integral - exact))
+        integral, info = adaptive_simpson(np.sin, 0, np.pi, tol=1e-12, max_evals=25)
+        self.assertFalse(info['converged'])
+        self.assertLessEqual(info['n_evals'], 25)
+
     def test_sor_solver(self):
         A = np.array([[4.0, 1.0, 1.0], [1.0, 3.0, 1.0], [1.0, 1.0, 5.0]])
         b = np.array([7.0, 8.0, 11.0])